@@ -42,11 +42,12 @@ standard_out = logging.StreamHandler(sys.stdout)
 standard_out.setLevel(logging.INFO)
 my_logger.addHandler(standard_out)
 
-def main(argslist=None, configfile=None):
+def main(argslist=None, configfile=None, shared_catalog=None):
     """Main command
 
     Args:
         argslist ([type], optional): List of arguments in the form of argv. Defaults to None.
+        shared_catalog (SchemaCatalog, optional): Catalog to use instead of building one, see shared_catalog.validate_targets. Defaults to None.
     """    
     argget = argparse.ArgumentParser(description='DMTF tool to test a service against a collection of Schema, version {}'.format(tool_version))
 
@@ -74,6 +75,7 @@ def main(argslist=None, configfile=None):
     argget.add_argument('--debugging', action="store_true", help='Output debug statements to text log, otherwise it only uses INFO')
     argget.add_argument('--uricheck', action="store_true", help='Allow URI checking on services below RedfishVersion 1.6.0')
     argget.add_argument('--schema_directory', type=str, default='./SchemaFiles/metadata', help='Directory for local schema files')
+    argget.add_argument('--compactcatalog', action="store_true", help='Keep the schema catalog compact by releasing parsed schema trees once loaded, for long or multi-target runs')
     argget.add_argument('--mockup', type=str, default='', help='Enables insertion of local mockup resources to replace missing, incomplete, or incorrect implementations retrieved from the service that may hinder full validation coverage')
 
     # parse...
@@ -143,7 +145,7 @@ def main(argslist=None, configfile=None):
         schema_pack.setup_schema_pack('latest', args.schema_directory, args.ext_http_proxy, args.ext_https_proxy)
 
     try:
-        currentService = traverse.rfService(vars(args))
+        currentService = traverse.rfService(vars(args), shared_catalog)
     except Exception as ex:
         traceback.print_exc()
         my_logger.verbose1('Exception caught while creating Service', exc_info=1)
@@ -233,6 +235,8 @@ def main(argslist=None, configfile=None):
     # dump cache info to debug log
     my_logger.debug('getSchemaDetails() -> {}'.format(schema.getSchemaDetails.cache_info()))
     my_logger.debug('callResourceURI() -> {}'.format(currentService.callResourceURI.cache_info()))
+    if currentService.catalog.leaf_memo is not None:
+        my_logger.debug('RedfishType.validate() leaf values -> {}'.format(currentService.catalog.leaf_memo.info()))
 
     if not success:
         my_logger.error("Validation has failed: {} problems found".format(fails))
@@ -104,6 +104,10 @@ g_config_defaults = {
         "mockup": {
             "value": "",
             "description": "Enables insertion of local mockup resources to replace payloads from the service"
+        },
+        "compactcatalog": {
+            "value": "False",
+            "description": "Whether to release parsed schema trees once loaded, for long or multi-target runs"
         }
     }
 }
@@ -1,29 +1,49 @@
-import glob, copy, difflib
+import glob, difflib
+import gc
+import itertools
 import logging
 import re
-from collections import namedtuple
+import sys
+from bisect import bisect_right
+from collections import Counter, OrderedDict, namedtuple
+from collections.abc import MutableMapping
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum, auto
 from os import path
+from types import MappingProxyType
 
-from bs4 import BeautifulSoup
-
+from redfish_service_validator.catalog_cache import CACHE_DIRNAME, CatalogSnapshot, hash_schema_data
+from redfish_service_validator.csdl import CSDL_LOADERS, DEFAULT_LOADER, CsdlAnnotation, CsdlElement, parse_csdl, scan_csdl_header
 from redfish_service_validator.helper import (
     getNamespace,
     getNamespaceUnversioned,
     getType,
+    getTypeName,
     getVersion,
     splitVersionString,
 )
-
-includeTuple = namedtuple("include", ["Namespace", "Uri"])
+from redfish_service_validator.uri_templates import URI_ID_REGEX, VALID_ID_REGEX, UriTemplateIndex, UriTemplateMatcher
+
+includeTuple = namedtuple("includeTuple", ["Namespace", "Uri"])
+schemaFileTuple = namedtuple("schemaFileTuple", ["path", "digest"])
+releasedTagTuple = namedtuple("releasedTagTuple", ["annotations", "enum_annotation", "members", "revisions"])
+resolutionTuple = namedtuple("resolutionTuple", ["value", "error"])
+# a link found in a populated object, with the attributes of the property it came from
+linkRecordTuple = namedtuple("linkRecordTuple", ["Name", "Value", "Type", "InAnnotation", "parent"])
+leafResultTuple = namedtuple("leafResultTuple", ["result", "error"])
+leafMemoInfoTuple = namedtuple("leafMemoInfoTuple", ["hits", "misses", "maxsize", "currsize"])
+additionalRuleTuple = namedtuple("additionalRuleTuple", ["type", "pattern", "allowed"])
 
 my_logger = logging.getLogger(__name__)
 
-REDFISH_ABSENT = "n/a"
 
-URI_ID_REGEX = '\{[A-Za-z0-9]*Id\}'
+def getVersionTuple(namespace):
+    """
+    Version tuple of a namespace or version string, see splitVersionString
+    """
+    return splitVersionString(getTypeName(namespace))
 
-VALID_ID_REGEX = '([A-Za-z0-9.!#$&-;=?\[\]_~])+'
+REDFISH_ABSENT = "n/a"
 
 # Excerpt definitions
 class ExcerptTypes(Enum):
@@ -40,7 +60,111 @@ excerpt_info_by_type = {
 
 allowed_annotations = ['odata', 'Redfish', 'Privileges', 'Message']
 
-def get_fuzzy_property(prop_name: str, jsondata: dict, allPropList=[]):
+FUZZY_CUTOFF = 0.70
+
+# unknown keys whose matches each FuzzyPropertyIndex remembers
+FUZZY_MEMO_SIZE = 256
+
+LEAF_MEMO_SIZE = 65536
+
+# values whose checks are remembered, see LeafResultMemo
+LEAF_MEMO_VALUE_TYPES = (str, int, float, bool)
+
+# terms read through RedfishType.getAnnotation, the only annotations a compact catalog keeps, see RedfishType.releaseTrees
+ANNOTATION_TERMS = frozenset([
+    'Capabilities.DeleteRestrictions', 'Capabilities.InsertRestrictions', 'Capabilities.UpdateRestrictions',
+    'OData.AdditionalProperties', 'Redfish.DynamicPropertyPatterns', 'Redfish.Required', 'Redfish.Uris',
+    'Validation.Maximum', 'Validation.Minimum', 'Validation.Pattern'
+])
+
+# documentation only, dropped from the tags of a compact catalog
+DESCRIPTION_TERMS = ('OData.Description', 'OData.LongDescription')
+
+
+def _intern_attrs(attrs):
+    # attribute names and most values repeat across every tag of a schema pack
+    return {sys.intern(x): sys.intern(y) for x, y in attrs.items()}
+
+
+def _fuzzy_ratio(matches, length):
+    # same arithmetic as difflib, so scores compare equal
+    return 2.0 * matches / length if length else 1.0
+
+
+class FuzzyPropertyIndex:
+    """
+    Property names of a type, bucketed by length, for get_fuzzy_property.
+
+    Gives the closest match difflib.get_close_matches would, but only scores the names whose length
+    and characters can reach the cutoff, and remembers the matches of the last maxsize keys.
+    """
+
+    def __init__(self, names, cutoff=FUZZY_CUTOFF, maxsize=FUZZY_MEMO_SIZE):
+        self.cutoff = cutoff
+        self.maxsize = maxsize
+        self.names = frozenset(names)
+        self.by_length = {}
+        for name in self.names:
+            self.by_length.setdefault(len(name), []).append((name, Counter(name)))
+        self.matches = OrderedDict()
+
+    def getMatches(self, word):
+        """
+        Get the names scoring at least the cutoff against a key, best first
+
+        :param word: key not found in the payload's properties
+        :return: list of (score, name), ordered as difflib ranks them
+        """
+        if word in self.matches:
+            self.matches.move_to_end(word)
+        else:
+            matcher = difflib.SequenceMatcher()
+            matcher.set_seq2(word)
+            word_chars = Counter(word)
+            matches = []
+            for length, names in self.by_length.items():
+                if _fuzzy_ratio(min(length, len(word)), length + len(word)) < self.cutoff:
+                    continue
+                for name, name_chars in names:
+                    if _fuzzy_ratio(sum((name_chars & word_chars).values()), length + len(word)) < self.cutoff:
+                        continue
+                    matcher.set_seq1(name)
+                    score = matcher.ratio()
+                    if score >= self.cutoff:
+                        matches.append((score, name))
+            matches.sort(reverse=True)
+            self.matches[word] = matches
+            # keys of OEM payloads and typos are endless, keep only the most recent
+            if len(self.matches) > self.maxsize:
+                self.matches.popitem(last=False)
+        return self.matches[word]
+
+    def getCloseMatches(self, word, names):
+        """
+        Get the closest of some names to a key, as difflib.get_close_matches(word, names, 1, cutoff)
+
+        Names outside the index, such as additional properties, are scored directly
+
+        :param word: key not found in the payload's properties
+        :param names: candidate names, such as the keys of RedfishObject.properties
+        :return: list holding the closest name, or empty
+        """
+        best = next((x for x in self.getMatches(word) if x[1] in names), None)
+        extra = [x for x in names if x not in self.names]
+        if extra:
+            matcher = difflib.SequenceMatcher()
+            matcher.set_seq2(word)
+            for name in extra:
+                if _fuzzy_ratio(min(len(name), len(word)), len(name) + len(word)) < self.cutoff:
+                    continue
+                matcher.set_seq1(name)
+                score = matcher.ratio()
+                if score >= self.cutoff and (best is None or (score, name) > best):
+                    best = (score, name)
+        return [best[1]] if best is not None else []
+
+
+def get_fuzzy_property(prop_name: str, jsondata: dict, allPropList=[], index=None):
     """
     Get property closest to the discovered property.
 
@@ -48,12 +172,16 @@ def get_fuzzy_property(prop_name: str, jsondata: dict, allPropList=[]):
         prop_name (str): Key of property
         jsondata (dict): Dictionary of payload
         allPropList (list, optional): List of possible properties of this particular payload. Defaults to [].
+        index (FuzzyPropertyIndex, optional): Index of the type's properties, see RedfishType.getFuzzyIndex. Defaults to None.
 
     Returns:
         prop_name: Closest match
         rtype: str
     """
-    possibleMatch = difflib.get_close_matches(prop_name, list(jsondata), 1, 0.70)
+    if index is not None:
+        possibleMatch = index.getCloseMatches(prop_name, jsondata)
+    else:
+        possibleMatch = difflib.get_close_matches(prop_name, list(jsondata), 1, FUZZY_CUTOFF)
     if len(possibleMatch) > 0 and possibleMatch[0] not in [
         s[2] for s in allPropList if s[2] != prop_name
     ]:
@@ -64,6 +192,17 @@ def get_fuzzy_property(prop_name: str, jsondata: dict, allPropList=[]):
     return prop_name
 
 
+def compile_schema_data(data, loader=DEFAULT_LOADER):
+    """
+    Header and parsed tree of a schema file, in a picklable form for process pool workers
+
+    :param data: CSDL document as a string
+    :param loader: name of the loader engine
+    :return: tuple of (header, document CsdlElement)
+    """
+    return scan_csdl_header(data), parse_csdl(data, loader)
+
+
 class MissingSchemaError(Exception):
     """
     Missing Schema Error.
@@ -81,38 +220,245 @@ class SchemaCatalog:
     From Catalog, you can get any Schema by it's filename, or its classes
     """
 
-    def __init__(self, filepath: str, metadata: object = None):
+    def __init__(self, filepath: str, metadata: object = None, use_snapshot: bool = True, loader: str = DEFAULT_LOADER, lazy: bool = True,
+                 workers: int = 1, compact: bool = False, snapshot_dir: str = None):
         """Init
 
         Args:
             filepath (str): Directory of metadata
             metadata (object, optional): Preestablished metadata. Defaults to None.
+            use_snapshot (bool, optional): Load unchanged documents from the compiled snapshot. Defaults to True.
+            loader (str, optional): CSDL loader engine, 'lxml' or 'soup'. Defaults to 'lxml'.
+            lazy (bool, optional): Only index files up front, building each SchemaDoc on first use. Defaults to True.
+            workers (int, optional): Processes used to parse files when building eagerly. Defaults to 1.
+            compact (bool, optional): Release the document trees once each SchemaDoc is built, see SchemaDoc.releaseTrees. Defaults to False.
+            snapshot_dir (str, optional): Directory of the compiled snapshot. Defaults to CACHE_DIRNAME inside filepath.
         """
+        if loader not in CSDL_LOADERS:
+            raise ValueError('Unknown CSDL loader {}, expected one of {}'.format(loader, list(CSDL_LOADERS)))
         self.filepath = filepath
+        self.loader = loader
+        self.lazy = lazy
+        self.workers = workers
+        self.compact = compact
         self.alias = {}
         self.catalog = {}
         self.catalog_by_class = {}
+        self.schema_files = {}
+        self.uri_templates = []
+        self.uri_index = None
         self.flags = {
-            'ignore_uri_checks': False
+            'ignore_uri_checks': False,
+            'generated_validators': False,
+            'iterative_populate': False,
+            'lazy_populate': False
         }
+        self.generation = 0
+        self.generated = None
+        # dense ids of type strings, for ancestry bitsets, see RedfishType.getAncestry
+        self.type_ids = {}
+        # results of checking primitive values against types, see RedfishType.validate
+        self.leaf_memo = LeafResultMemo()
+        # results of resolving payload names, see resolve
+        self.resolutions = {}
+        self._resolution_generation = 0
+        self.snapshot = CatalogSnapshot(snapshot_dir if snapshot_dir is not None else path.join(filepath, CACHE_DIRNAME), loader)
+        self.snapshot.enabled = use_snapshot
         my_logger.debug("Creating Schema catalog from filepath {}".format(filepath))
 
-        # create SchemaDoc objects
-        for x in glob.glob(path.join(filepath, "*")):
+        # index files, then create SchemaDoc objects unless they're built on demand
+        # the cyclic collector only slows down building this many long-lived objects, hold it until we're done
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self._indexSchemaFiles(filepath)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        self.snapshot.prune()
+
+    def _indexSchemaFiles(self, filepath):
+        file_paths = glob.glob(path.join(filepath, "*"))
+        compiled = {}
+        if not self.lazy and self.workers > 1:
+            compiled = self._compileSchemaFiles(file_paths)
+
+        for x in file_paths:
+            self._indexSchemaFile(x, compiled)
+
+    def _indexSchemaFile(self, file_path, compiled):
+        with open(file_path) as f:
+            my_name = path.split(file_path)[-1]
+            data = f.read()
+        # reuse the stored header if this file is unchanged, otherwise scan it
+        digest = hash_schema_data(data)
+        header, tree = compiled.get(digest, (None, None))
+        if header is None:
+            header = self.snapshot.load_header(digest)
+        if header is None:
+            header = scan_csdl_header(data)
+        self.snapshot.store_header(digest, header)
+        namespaces, aliases, uris = header
+        self.schema_files[my_name] = schemaFileTuple(file_path, digest)
+
+        base_names = [getNamespaceUnversioned(x) for x in namespaces if getNamespaceUnversioned(x) not in namespaces]
+        for item in list(namespaces) + base_names:
+            if item not in self.catalog_by_class:
+                self.catalog_by_class[item] = [my_name]
+            else:
+                self.catalog_by_class[item].append(my_name)
+        self.alias.update(aliases)
+        self.uri_templates.extend(uris)
+
+        if not self.lazy:
+            self._loadSchemaDoc(my_name, data, tree)
+
+    def indexNewSchemaFiles(self):
+        """
+        Index schema files added to the directory after the catalog was built, such as those
+        downloaded for a service's $metadata, and drop the values derived from the old index
+
+        Files already in the catalog are not read again
+
+        :return: list of the file names added
+        """
+        new_paths = []
+        for x in glob.glob(path.join(self.filepath, "*")):
+            if path.split(x)[-1] in self.schema_files:
+                continue
+            # another process may still be writing it, it's picked up by a later call
+            try:
+                self._indexSchemaFile(x, {})
+            except Exception as e:
+                my_logger.debug("Could not index schema file {}: {}".format(x, repr(e)))
+                continue
+            new_paths.append(x)
+        if new_paths:
+            my_logger.debug("Indexed {} new schema files in {}".format(len(new_paths), self.filepath))
+            self.uri_index = None
+            self.generated = None
+            self.invalidateCaches()
+        return [path.split(x)[-1] for x in new_paths]
+
+    def _compileSchemaFiles(self, file_paths):
+        # parse the files missing from the snapshot on a process pool, results are merged by the caller in glob order
+        pending = {}
+        for x in file_paths:
             with open(x) as f:
-                my_name = path.split(x)[-1]
-                schema = SchemaDoc(f.read(), self, my_name)
-                self.catalog[my_name] = schema
-
-            base_names = [getNamespaceUnversioned(x) for x in schema.classes if getNamespaceUnversioned(x) not in schema.classes]
-            for item in list(schema.classes.keys()) + base_names:
-                if item not in self.catalog_by_class:
-                    self.catalog_by_class[item] = [schema]
-                else:
-                    self.catalog_by_class[item].append(schema)
-        
-        for _, schema in self.catalog.items():
-            self.alias.update(schema.alias)
+                data = f.read()
+            digest = hash_schema_data(data)
+            if digest not in pending and not self.snapshot.contains(digest):
+                pending[digest] = data
+        if not pending:
+            return {}
+        my_logger.debug("Parsing {} schema files with {} workers".format(len(pending), self.workers))
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            results = executor.map(compile_schema_data, pending.values(), [self.loader] * len(pending), chunksize=4)
+            return dict(zip(pending, results))
+
+    def _loadSchemaDoc(self, my_name, data=None, tree=None):
+        my_file = self.schema_files[my_name]
+        if tree is not None:
+            self.snapshot.store(my_file.digest, tree)
+        else:
+            tree = self._readSchemaTree(my_name, data)
+        schema = SchemaDoc(tree, self, my_name)
+        if self.compact:
+            schema.releaseTrees()
+        self.catalog[my_name] = schema
+        return schema
+
+    def _readSchemaTree(self, my_name, data=None):
+        # reuse the compiled document if this file is unchanged
+        my_file = self.schema_files[my_name]
+        tree = self.snapshot.load(my_file.digest)
+        if tree is None:
+            # otherwise parse it and patch the snapshot
+            if data is None:
+                with open(my_file.path) as f:
+                    data = f.read()
+            tree = parse_csdl(data, self.loader)
+            self.snapshot.store(hash_schema_data(data), tree)
+        return tree
+
+    def getSchemaDoc(self, name):
+        """
+        Get Document by file name, building it on first use
+
+        :param name: file name in the schema directory
+        :type name: str
+        :raises MissingSchemaError: Missing schema in Catalog
+        :return: Schema Document
+        :rtype: SchemaDoc
+        """
+        if name in self.catalog:
+            return self.catalog[name]
+        if name not in self.schema_files:
+            raise MissingSchemaError("Could not find any Schema file {}".format(name))
+        my_logger.debug("Building Schema document {}".format(name))
+        return self._loadSchemaDoc(name)
+
+    def getUriIndex(self):
+        """
+        Get the trie of the Redfish.Uris templates of all types in the catalog, built on first use
+
+        :return: UriTemplateIndex
+        """
+        if self.uri_index is None:
+            self.uri_index = UriTemplateIndex()
+            for fulltype, templates in self.uri_templates:
+                for template in templates:
+                    self.uri_index.add(template, fulltype)
+        return self.uri_index
+
+    def getGeneratedValidators(self):
+        """
+        Get the generated validators of the catalog, see codegen
+
+        :return: GeneratedValidators
+        """
+        if self.generated is None:
+            from redfish_service_validator.codegen import GeneratedValidators
+            self.generated = GeneratedValidators(self)
+        return self.generated
+
+    def invalidateCaches(self):
+        """
+        Drop values each RedfishType derived from the catalog (type trees, property maps, base types),
+        to be called after changing the catalog's documents
+        """
+        self.generation += 1
+
+    def getTypeId(self, fulltype):
+        """
+        Get the id of a type string, assigning the next free id on first use
+
+        Ids are never reused, so they stay valid across invalidateCaches
+
+        :param fulltype: type string, such as Resource.Resource or Edm.String
+        :return: int
+        """
+        fulltype = str(fulltype)
+        if fulltype not in self.type_ids:
+            self.type_ids[fulltype] = len(self.type_ids)
+        return self.type_ids[fulltype]
+
+    def getTypeMask(self, *fulltypes):
+        """
+        Get the bitset of type strings, to compare with RedfishType.getAncestry
+
+        Types without an id are in no type tree, and add no bit
+
+        :param fulltypes: type strings
+        :return: int
+        """
+        mask = 0
+        for fulltype in fulltypes:
+            type_id = self.type_ids.get(fulltype)
+            if type_id is not None:
+                mask |= 1 << type_id
+        return mask
 
     def getSchemaDocByClass(self, typename):
         """
@@ -129,10 +475,47 @@ class SchemaCatalog:
         typename = getNamespaceUnversioned(typename)
         typename = self.alias.get(typename, typename)
         if typename in self.catalog_by_class:
-            return self.catalog_by_class[typename][0]
+            return self.getSchemaDoc(self.catalog_by_class[typename][0])
         else:
             raise MissingSchemaError( "Could not find any Schema with these parameters {}".format(typename))
 
+    def resolve(self, kind, name):
+        """
+        Resolve a name found in payloads, remembering the result or the error of each name
+
+        Kinds are 'term' for annotation terms such as Redfish.Deprecated, giving the term's RedfishType,
+        'type' for @odata.type values, giving the RedfishType, and 'action' for action names, giving the SchemaClass or None.
+        Names recur across every resource of a service, so a repeat costs one lookup, and a failed one raises nothing
+
+        :param kind: 'term', 'type' or 'action'
+        :param name: term, type string or action name, without '#'
+        :return: resolutionTuple, error is a new exception like the one raised when resolving, or None
+        """
+        if self._resolution_generation != self.generation:
+            self.resolutions = {}
+            self._resolution_generation = self.generation
+        if kind not in ['term', 'type', 'action']:
+            raise ValueError('Unknown kind of name {}'.format(kind))
+        key = (kind, name)
+        if key not in self.resolutions:
+            try:
+                if kind == 'term':
+                    value = self.getSchemaInCatalog(name).terms[getType(name)]
+                elif kind == 'type':
+                    value = self.getSchemaDocByClass(name).getTypeInSchemaDoc(name)
+                else:
+                    namespace = getNamespace(name)
+                    value = self.getSchemaDocByClass(namespace).classes.get(namespace)
+                self.resolutions[key] = resolutionTuple(value, None)
+            except Exception as e:
+                # keep the class and arguments only, a stored instance would keep every traceback it's raised with
+                self.resolutions[key] = resolutionTuple(None, (type(e), e.args))
+        value, error = self.resolutions[key]
+        if error is not None:
+            error_type, error_args = error
+            return resolutionTuple(None, error_type(*error_args))
+        return self.resolutions[key]
+
     def getSchemaInCatalog(self, typename):
         """
         Get Schema by class
@@ -168,14 +551,15 @@ class SchemaCatalog:
 class SchemaDoc:
     """Represents a schema document."""
 
-    def __init__(self, data: str, catalog: SchemaCatalog = None, name: str = None):
-        # set up document
-        self.soup = BeautifulSoup(data, "xml")
+    def __init__(self, data, catalog: SchemaCatalog = None, name: str = None):
+        # set up document, either from text or an already parsed tree
+        self._soup = data if isinstance(data, CsdlElement) else parse_csdl(data, catalog.loader if catalog is not None else DEFAULT_LOADER)
         self.name = str(name)
         self.origin = "local"
         self.catalog = catalog
         self.classes = {}
         self.alias = {}
+        self.version_index = None
 
         edmxTag = self.soup.find("Edmx", recursive=False)
         reftags = edmxTag.find_all("Reference", recursive=False)
@@ -211,6 +595,67 @@ class SchemaDoc:
             )
         )
 
+    @property
+    def soup(self):
+        """Document tree, parsed again on each use once released"""
+        if self._soup is None:
+            my_logger.debug('Parsing released Schema document {} again'.format(self.name))
+            return self.catalog._readSchemaTree(self.name)
+        return self._soup
+
+    def releaseTrees(self):
+        """
+        Drop the document tree, and the tags kept by our classes and types
+
+        What is read from them after loading is kept in plain structures;
+        the trees are only parsed again for the rare lookups that still need them
+        """
+        for my_class in self.classes.values():
+            my_class.releaseTrees()
+        self._soup = None
+
+    def _getVersionIndex(self):
+        # type name -> versions of the namespaces defining it, sorted, with the namespace to cast to at or below each version
+        if self.version_index is None:
+            entries = {}
+            for position, (namespace, schema) in enumerate(self.classes.items()):
+                version = getVersionTuple(namespace)
+                for my_type in schema.my_types:
+                    entries.setdefault(my_type, []).append((version, position, namespace))
+            self.version_index = {}
+            for my_type, my_entries in entries.items():
+                my_entries.sort(key=lambda x: x[0])
+                versions, namespaces, best = [], [], None
+                for version, position, namespace in my_entries:
+                    # the latest namespace in document order wins among those at or below a version
+                    if best is None or position > best[0]:
+                        best = (position, namespace)
+                    versions.append(version)
+                    namespaces.append(best[1])
+                self.version_index[my_type] = (versions, namespaces, [(x[0], x[2]) for x in my_entries])
+        return self.version_index
+
+    def getTypeVersions(self, my_type):
+        """
+        Get the namespaces of this document defining a type
+
+        :param my_type: type name, without namespace
+        :return: list of (version tuple, namespace), sorted by version
+        """
+        return self._getVersionIndex().get(my_type, ((), (), []))[2]
+
+    def getCastNamespace(self, my_type, limit):
+        """
+        Get the namespace to cast a type to: the last namespace of this document defining it, at or below a version limit
+
+        :param my_type: type name, without namespace
+        :param limit: namespace or version string limiting the version
+        :return: namespace, or None
+        """
+        versions, namespaces, _ = self._getVersionIndex().get(my_type, ((), (), []))
+        position = bisect_right(versions, getVersionTuple(limit))
+        return namespaces[position - 1] if position else None
+
     def getReference(self, namespace):
         """getSchemaFromReference
 
@@ -267,8 +712,8 @@ class SchemaClass:
         super().__init__()
         self.parent_doc = owner
         self.catalog = owner.catalog
-        self.class_soup = soup
-        self.class_name = soup["Namespace"]
+        self._class_soup = soup
+        self.class_name = getTypeName(soup["Namespace"])
         self.entity_types, self.complex_types, self.enum_types, self.def_types = {}, {}, {}, {}
 
         for x in self.class_soup.find_all(["EntityType"], recursive=False):
@@ -293,6 +738,38 @@ class SchemaClass:
 
         self.my_types = {**self.entity_types, **self.complex_types, **self.enum_types, **self.def_types}
 
+        # types of additional properties by Edm type, see getSyntheticType
+        self.synthetic_types = {}
+
+    @property
+    def class_soup(self):
+        """Schema tag, found in a newly parsed document once released"""
+        if self._class_soup is None:
+            return self.parent_doc.soup.find('Schema', attrs={'Namespace': self.class_name})
+        return self._class_soup
+
+    def getSyntheticType(self, edm_type):
+        """
+        Get the type of additional properties of an Edm type, as a Term of this Schema
+
+        Built once per Edm type from a plain tag, and shared by every property using it
+
+        :param edm_type: Edm type string, such as Edm.String
+        :return: RedfishType
+        """
+        if edm_type not in self.synthetic_types:
+            tag = CsdlElement('Term', {'Name': 'AdditionalProperty', 'Type': edm_type})
+            self.synthetic_types[edm_type] = RedfishType(tag, self)
+        return self.synthetic_types[edm_type]
+
+    def releaseTrees(self):
+        """
+        Drop our Schema tag, and the tags of our types and terms, see SchemaDoc.releaseTrees
+        """
+        for my_type in list(self.my_types.values()) + list(self.terms.values()):
+            my_type.releaseTrees()
+        self._class_soup = None
+
     def getHighestType(self, my_full_type, limit=None):
         """
         Get Highest possible version for given type.
@@ -300,7 +777,6 @@ class SchemaClass:
         :param acquiredtype: Type available
         :param limit: Version string limit (full namespace or just version 'v1_x_x')
         """
-        typelist = []
         my_type = getType(my_full_type)
 
         if limit is not None:
@@ -310,15 +786,15 @@ class SchemaClass:
             else:
                 limit = getVersion(limit)
 
-        for _, schema in self.parent_doc.classes.items():
-            newNamespace = schema.class_name
+        # versions of the namespaces in our document that define this type
+        typelist = []
+        for version, newNamespace in self.parent_doc.getTypeVersions(my_type):
             if limit is not None:
                 if getVersion(newNamespace) is None:
                     continue
-                if splitVersionString(newNamespace) > splitVersionString(limit):
+                if version > getVersionTuple(limit):
                     continue
-            if (my_type in self.my_types):
-                typelist.append(splitVersionString(newNamespace))
+            typelist.append(version)
 
         if len(typelist) > 1:
             for ns in reversed(sorted(typelist)):
@@ -347,9 +823,15 @@ class RedfishType:
 
         self.owner = owner
         self.catalog = owner.catalog
+        self._cache = {}
+        self._cache_generation = None
 
-        self.type_soup = soup
+        self._type_soup = soup
+        self.type_attrs = soup.attrs
         self.tag_type = soup.name
+        # (tag name, Name) of our tag and its parents within the Schema tag, to find it again once released
+        self.tag_path = ((soup.name, soup.get('Name')),)
+        self.released = None
 
         if self.tag_type in ['NavigationProperty', 'Property', 'Term']:
             self.IsPropertyType = True
@@ -358,7 +840,7 @@ class RedfishType:
         else:
             self.IsPropertyType = False
             self.IsNav = False
-            self.fulltype = self.owner.class_name + '.' + soup['Name']
+            self.fulltype = getTypeName(self.owner.class_name + '.' + soup['Name'])
         self.Namespace, self.Type = getNamespace(self.fulltype), getType(self.fulltype)
 
         self.tags = {}
@@ -401,9 +883,110 @@ class RedfishType:
         for innerelement in prop_tags:
             prop_name = innerelement["Name"]
             self.unique_properties[prop_name] = RedfishType(innerelement, self.owner)
+            self.unique_properties[prop_name].tag_path = self.tag_path + self.unique_properties[prop_name].tag_path
+
+    @property
+    def type_soup(self):
+        """Our tag, found in a newly parsed document once released"""
+        if self._type_soup is None:
+            tag = self.owner.class_soup
+            for tag_name, name in self.tag_path:
+                tag = tag.find(tag_name, attrs={'Name': name}, recursive=False)
+            return tag
+        return self._type_soup
+
+    def releaseTrees(self):
+        """
+        Keep what is read from our tag after loading in plain structures, and drop the tag, see SchemaDoc.releaseTrees
+
+        Annotations outside ANNOTATION_TERMS and descriptions in tags are dropped
+        """
+        if self._type_soup is None:
+            return
+        soup = self._type_soup
+        # only annotations that are read later are kept, documentation is dropped
+        annotations = {x: CsdlAnnotation(_intern_attrs(y.attrs), tuple(_intern_attrs(z) for z in y.property_values), y.strings)
+                       for x, y in self._getAnnotationIndex().items() if x in ANNOTATION_TERMS}
+        enum_annotation = self._getEnumAnnotation()
+        self.released = releasedTagTuple(
+            annotations,
+            CsdlAnnotation(_intern_attrs(enum_annotation.attrs), tuple(_intern_attrs(z) for z in enum_annotation.property_values))
+            if enum_annotation is not None else None,
+            tuple(x["Name"] for x in soup.find_all("Member")),
+            self.getRevisions())
+        self.type_attrs = _intern_attrs(self.type_attrs)
+        self.tags = {x: _intern_attrs(y) if isinstance(y, dict) else y for x, y in self.tags.items() if x not in DESCRIPTION_TERMS}
+        self.Deprecated = self.tags.get('Redfish.Deprecated')
+        # Redfish.Revisions records are read through getRevisions from now on
+        if self.Revisions is not None:
+            self.Revisions = self.tags['Redfish.Revisions'] = self.released.revisions
+        # values memoized from the tag are found again in the released structures
+        self._cache = {}
+        self._cache_generation = None
+        self._type_soup = None
+        for my_property in self.unique_properties.values():
+            my_property.releaseTrees()
+
+    def getEnumMembers(self):
+        """
+        Returns names of the Member tags within our tag
+        """
+        if self.released is not None:
+            return self.released.members
+        return tuple(x["Name"] for x in self.type_soup.find_all("Member"))
     
+    def getAnnotation(self, term):
+        """
+        Get the first Annotation tag with this Term anywhere within our tag, from an index built on first use
+
+        Once released, only terms in ANNOTATION_TERMS are found
+
+        :param term: annotation term, such as 'Redfish.Uris'
+        :return: CsdlAnnotation, or None
+        """
+        return self._memo('annotations', self._getAnnotationIndex).get(term)
+
+    def _getAnnotationIndex(self):
+        if self.released is not None:
+            return self.released.annotations
+        annotations = {}
+        for tag in self.type_soup.find_all("Annotation"):
+            term = tag.get("Term")
+            if term is not None and term not in annotations:
+                annotations[term] = CsdlAnnotation.from_element(tag)
+        return annotations
+
+    def _getEnumAnnotation(self):
+        # our own Redfish.Enumeration annotation, not one of a tag within ours
+        if self.released is not None:
+            return self.released.enum_annotation
+        tag = self.type_soup.find('Annotation', attrs={'Term': 'Redfish.Enumeration'}, recursive=False)
+        return CsdlAnnotation.from_element(tag) if tag is not None else None
+
+    def getRevisions(self):
+        """
+        Returns (is deprecated, description or None, version or False) of each Redfish.Revisions record, or None
+        """
+        if self.released is not None:
+            return self.released.revisions
+        if self.Revisions is None:
+            return None
+        revisions = []
+        for tag_item in self.Revisions:
+            revision_tag = tag_item.find('PropertyValue', attrs={ 'EnumMember': 'Redfish.RevisionKind/Deprecated', 'Property': 'Kind'})
+            desc_tag = tag_item.find('PropertyValue', attrs={'Property': 'Description'})
+            version_tag = tag_item.find('PropertyValue', attrs={'Property': 'Version'})
+            revisions.append((
+                revision_tag is not None,
+                desc_tag.attrs.get('String', '') if desc_tag else None,
+                version_tag.attrs.get('String', False) if version_tag else False))
+        return tuple(revisions)
+
     @property
     def HasAdditional(self):
+        return self._memo('has_additional', self._getHasAdditional)
+
+    def _getHasAdditional(self):
         my_parents = self.getTypeTree()
         for my_type in my_parents:
             if not isinstance(my_type, RedfishType): continue
@@ -411,7 +994,7 @@ class RedfishType:
                 return True
             if my_type == 'MessageRegistry.v1_0_0.MessageProperty':
                 return True
-            additionalElement = my_type.type_soup.find("Annotation", attrs={"Term": "OData.AdditionalProperties"})
+            additionalElement = my_type.getAnnotation("OData.AdditionalProperties")
             HasAdditional = ( False if additionalElement is None else (
                     True if additionalElement.get("Bool", False) in ["True", "true", True]
                     else False))
@@ -431,6 +1014,9 @@ class RedfishType:
         return self.getCapabilities()['CanInsert']
 
     def getCapabilities(self):
+        return dict(self._memo('capabilities', self._getCapabilities))
+
+    def _getCapabilities(self):
         my_dict = {'CanUpdate': False,
                    'CanInsert': False,
                    'CanDelete': False}
@@ -439,15 +1025,15 @@ class RedfishType:
         for my_type in reversed(my_parents):
             if not isinstance(my_type, RedfishType): continue
             try:
-                element = my_type.type_soup.find("Annotation", attrs={"Term": "Capabilities.InsertRestrictions"})
+                element = my_type.getAnnotation("Capabilities.InsertRestrictions")
                 if element:
-                    my_dict['CanInsert'] = element.find("PropertyValue").get('Bool', 'False').lower() == 'true'
-                element = my_type.type_soup.find("Annotation", attrs={"Term": "Capabilities.UpdateRestrictions"})
+                    my_dict['CanInsert'] = element.property_values[0].get('Bool', 'False').lower() == 'true'
+                element = my_type.getAnnotation("Capabilities.UpdateRestrictions")
                 if element:
-                    my_dict['CanUpdate'] = element.find("PropertyValue").get('Bool', 'False').lower() == 'true'
-                element = my_type.type_soup.find("Annotation", attrs={"Term": "Capabilities.DeleteRestrictions"})
+                    my_dict['CanUpdate'] = element.property_values[0].get('Bool', 'False').lower() == 'true'
+                element = my_type.getAnnotation("Capabilities.DeleteRestrictions")
                 if element:
-                    my_dict['CanDelete'] = element.find("PropertyValue").get('Bool', 'False').lower() == 'true'
+                    my_dict['CanDelete'] = element.property_values[0].get('Bool', 'False').lower() == 'true'
             except Exception as e:
                 my_logger.debug('Exception caught while checking Uri', exc_info=1)
                 my_logger.warning('Could not gather info from Capabilities annotation')
@@ -457,15 +1043,19 @@ class RedfishType:
 
     @property
     def DynamicProperties(self):
+        my_dynamic = self._memo('dynamic_properties', self._getDynamicProperties)
+        return dict(my_dynamic) if my_dynamic is not None else None
+
+    def _getDynamicProperties(self):
         my_parents = self.getTypeTree()
         for my_type in reversed(my_parents):
             if not isinstance(my_type, RedfishType): continue
             try:
-                dynamic = my_type.type_soup.find("Annotation", attrs={"Term": "Redfish.DynamicPropertyPatterns"})
+                dynamic = my_type.getAnnotation("Redfish.DynamicPropertyPatterns")
                 if dynamic: 
                     # create PropertyPattern dict containing pattern and type for DynamicPropertyPatterns validation
-                    pattern_elem = dynamic.find("PropertyValue", Property="Pattern")
-                    type_elem = dynamic.find("PropertyValue", Property="Type")
+                    pattern_elem = dynamic.getPropertyValue("Pattern")
+                    type_elem = dynamic.getPropertyValue("Type")
                     if pattern_elem and type_elem:
                         return {
                             "Pattern": pattern_elem.get("String"),
@@ -482,6 +1072,63 @@ class RedfishType:
         return None
 
 
+    def getAdditionalRule(self):
+        """
+        Returns how payload keys outside our properties are added, from Redfish.DynamicPropertyPatterns or OData.AdditionalProperties
+
+        :return: additionalRuleTuple of the type string of added keys, the pattern of their names, and whether any are added
+        """
+        my_dynamic = self.DynamicProperties
+        if my_dynamic:
+            return additionalRuleTuple(my_dynamic.get('Type', 'Resource.OemObject'), my_dynamic.get('Pattern', '.*'), True)
+        return additionalRuleTuple('Resource.OemObject', '.*', self.HasAdditional)
+
+    def getAdditionalType(self, odata_type):
+        """
+        Returns the type of keys added under a type string, see getAdditionalRule
+
+        :param odata_type: type string, such as Edm.String or Resource.OemObject
+        :raises MissingSchemaError: Missing schema in Catalog
+        :rtype: RedfishType
+        """
+        if 'Edm.' in odata_type:
+            return self.owner.getSyntheticType(odata_type)
+        return self.catalog.getSchemaDocByClass(odata_type).getTypeInSchemaDoc(odata_type)
+
+    def getExcerptMembers(self, payload):
+        """
+        Returns the excerpt type and tags of each key of a payload, typed as populating it would type them
+
+        Our properties come first in their order, then added keys and annotations in the payload's order,
+        so it costs a pass over the payload instead of populating it
+
+        :param payload: dict value of our type
+        :raises MissingSchemaError: Missing schema of added keys in Catalog
+        :return: list of (name, excerptType, excerptTags)
+        """
+        my_members = self._memo('excerpt_members', lambda: MappingProxyType(
+            {x: (cnt, y.excerptType, y.excerptTags) for cnt, (x, y) in enumerate(self.getProperties().items())}))
+        found, added, annotations = [], [], []
+        my_rule = None
+        for key in payload:
+            if key in my_members:
+                found.append((key, *my_members[key]))
+            elif '@' not in key:
+                if my_rule is None:
+                    my_rule = self.getAdditionalRule()
+                if my_rule.allowed and re.match(my_rule.pattern, key):
+                    type_obj = self.getAdditionalType(my_rule.type)
+                    added.append((key, type_obj.excerptType, type_obj.excerptTags))
+            elif '@odata' not in key:
+                fullItem = key.split('@', 1)[1]
+                if getNamespace(fullItem) not in allowed_annotations:
+                    continue
+                type_obj, error = self.catalog.resolve('term', fullItem)
+                if error is None:
+                    annotations.append((key, type_obj.excerptType, type_obj.excerptTags))
+        found.sort(key=lambda x: x[1])
+        return [(x, y, z) for x, _, y, z in found] + added + annotations
+
     def getUris(self):
         """
         Return Redfish.Uris annotation values
@@ -489,21 +1136,47 @@ class RedfishType:
         :return: Array of Uris
         :rtype: list
         """
+        return list(self._memo('uris', self._getUris))
+
+    def _getUris(self):
         my_parents = self.getTypeTree()
         expectedUris = []
         for my_type in my_parents:
             if not isinstance(my_type, RedfishType): continue
-            uriElement = my_type.type_soup.find("Annotation", attrs={"Term": "Redfish.Uris"})
+            uriElement = my_type.getAnnotation("Redfish.Uris")
             if uriElement is not None:
                 try:
-                    all_strings = uriElement.find("Collection").find_all("String")
-                    expectedUris += [e.contents[0] for e in all_strings]
+                    if None in uriElement.strings:
+                        raise ValueError('Empty Redfish.Uris value')
+                    expectedUris += list(uriElement.strings)
                 except Exception as e:
                     my_logger.debug('Exception caught while checking Uri', exc_info=1)
                     my_logger.warning('Could not gather info from Redfish.Uris annotation')
                     expectedUris = []
-        return expectedUris
+        return tuple(expectedUris)
+
+    def getUriMatcher(self):
+        """
+        Return a compiled matcher of our Redfish.Uris annotation values
+
+        :rtype: UriTemplateMatcher
+        """
+        return self._memo('uri_matcher', lambda: UriTemplateMatcher(self.getUris()))
      
+    def _memo(self, key, compute):
+        """
+        Get a value derived from the catalog, computing it on first use
+
+        Values are kept until SchemaCatalog.invalidateCaches is called; failures are not kept
+        """
+        generation = self.catalog.generation if self.catalog is not None else 0
+        if self._cache_generation != generation:
+            self._cache = {}
+            self._cache_generation = generation
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
     @property 
     def parent_type(self):
         """
@@ -513,31 +1186,60 @@ class RedfishType:
             string, boolean
             None, False
         """
-        soup = self.type_soup
+        return self._memo('parent_type', self._getParentType)
+
+    def _getParentType(self):
+        attrs = self.type_attrs
         parent_type = (
-            soup["UnderlyingType"] if self.tag_type == "TypeDefinition"
-            else soup.get("BaseType", soup.get("Type", None))
+            attrs["UnderlyingType"] if self.tag_type == "TypeDefinition"
+            else attrs.get("BaseType", attrs.get("Type", None))
         )
         if parent_type is not None:
             IsCollection = re.match('Collection\(.*\)', parent_type) is not None
-            return parent_type.replace('Collection(', "").replace(')', ""), IsCollection
+            return getTypeName(parent_type.replace('Collection(', "").replace(')', "")), IsCollection
         else:
             return None, False
         
+    def getAncestry(self):
+        """
+        Returns bitset of the ids of every type in our type tree, see SchemaCatalog.getTypeId
+        """
+        return self._memo('ancestry', self._getAncestry)
+
+    def _getAncestry(self):
+        ancestry = 0
+        for type_obj in self.getTypeTree():
+            ancestry |= 1 << self.catalog.getTypeId(type_obj)
+        return ancestry
+
+    def isA(self, *fulltypes):
+        """
+        Returns if any of the type strings is in our type tree, as 'Resource.Resource' in getTypeTree()
+        """
+        if self.catalog is None:
+            return any(x in self.getTypeTree() for x in fulltypes)
+        return (self.getAncestry() & self.catalog.getTypeMask(*fulltypes)) != 0
+
     def getTypeTree(self, tree=None):
         """
         Returns tree of RedfishType/string of parent types
         """
-        if not tree: tree = [self]
+        lineage = self._memo('lineage', self._getLineage)
+        if not tree:
+            return list(lineage)
+        return tree + list(lineage[1:])
+
+    def _getLineage(self):
+        lineage = [self]
         my_type, collection = self.parent_type
         if my_type:
             if 'Edm.' not in my_type:
                 my_real_type = my_type
                 type_obj = self.owner.parent_doc.catalog.getSchemaDocByClass(my_real_type).getTypeInSchemaDoc(my_real_type)
-                return type_obj.getTypeTree(tree + [type_obj])
+                lineage += type_obj.getTypeTree()
             else:
-                return tree + [my_type]
-        return tree
+                lineage.append(my_type)
+        return tuple(lineage)
 
     def getBaseType(self, is_collection=False):
         """
@@ -550,6 +1252,9 @@ class RedfishType:
             string, boolean
             None, False
         """
+        return self._memo(('base_type', is_collection), lambda: self._getBaseType(is_collection))
+
+    def _getBaseType(self, is_collection):
         if self.tag_type == "EnumType":
             return 'enum', is_collection
         if self.tag_type == "ComplexType":
@@ -567,37 +1272,96 @@ class RedfishType:
 
     def getProperties(self):
         """
-        Returns all our properties from our current type and its parents
+        Returns all our properties from our current type and its parents, as a read-only mapping
         """
+        return self._memo('properties', self._getProperties)
+
+    def _getProperties(self):
         all_properties = {}
         for type_obj in self.getTypeTree():
             all_properties.update(type_obj.unique_properties)
-        return all_properties
+        return MappingProxyType(all_properties)
+
+    def getFuzzyIndex(self):
+        """
+        Returns an index of our property names, for get_fuzzy_property
+
+        :rtype: FuzzyPropertyIndex
+        """
+        return self._memo('fuzzy_index', lambda: FuzzyPropertyIndex(self.getProperties()))
+
+    def getValidationPlan(self):
+        """
+        Returns what checking a value against this type needs from its tags, read once
+
+        :rtype: ValidationPlan
+        """
+        return self._memo('validation_plan', lambda: ValidationPlan(self))
+
+    def getLeafCheck(self):
+        """
+        Returns the pattern, minimum, maximum and Redfish.Enumeration pattern of a type built on an Edm type
+
+        :return: tuple of compiled pattern or None, int or None, int or None, compiled pattern or None
+        """
+        return self._memo('leaf_check', self._getLeafCheck)
+
+    def _getLeafCheck(self):
+        my_type, collection = self.parent_type
+        enum_annotation = self._getEnumAnnotation()
+        validPatternAttr = self.getAnnotation('Validation.Pattern')
+        validMinAttr = self.getAnnotation('Validation.Minimum')
+        validMaxAttr = self.getAnnotation('Validation.Maximum')
+        validMin, validMax = int(validMinAttr['Int']) if validMinAttr is not None else None, \
+            int(validMaxAttr['Int']) if validMaxAttr is not None else None
+        validPattern = validPatternAttr.get('String', '') if validPatternAttr is not None else None
+
+        enumPattern = None
+        if my_type == 'Edm.String' and enum_annotation is not None:
+            memberList = [x for x in enum_annotation.property_values if x.get('Property') == 'Member']
+            enumPattern = re.compile('|'.join([re.escape(x.get('String')) for x in memberList if x.get('String')]))
+
+        return re.compile(validPattern) if validPattern is not None else None, validMin, validMax, enumPattern
 
     def validate(self, val, added_pattern=None):
         """
         Returns True if validation succeeds, else raises a ValueError
+
+        Checks of primitive values are remembered in the catalog's LeafResultMemo
         """
+        memo = self.catalog.leaf_memo if self.catalog is not None else None
+        if memo is not None and type(val) in LEAF_MEMO_VALUE_TYPES:
+            # types get a new key after SchemaCatalog.invalidateCaches, leaving older results to age out
+            key = (self._memo('leaf_memo_key', memo.newTypeKey), type(val), val, added_pattern)
+            return memo.check(key, lambda: self._validate(val, added_pattern))
+        return self._validate(val, added_pattern)
+
+    def _validate(self, val, added_pattern=None):
+        if self.IsPropertyType and self.catalog is not None and self.catalog.flags['generated_validators']:
+            generated_check = self.catalog.getGeneratedValidators().getPropertyCheck(self)
+            if generated_check is not None:
+                return generated_check(val, added_pattern)
         my_logger.debug((self, val, self.fulltype, self.tag_type, self.parent_type))
+        plan = self.getValidationPlan()
         if val == REDFISH_ABSENT:
-            if self.type_soup.find("Annotation", attrs={"Term": "Redfish.Required"}):
+            if plan.IsRequired:
                 raise ValueError("Should not be absent")
             else:
                 return True
         if val is None: 
-            if self.type_soup.get("Nullable") in ["false", "False", False]:
+            if not plan.IsNullable:
                 raise ValueError("Should not be null")
             else:
                 return True
         # recurse parent_types until we get a basic type...
         if self.tag_type == "EnumType":
-            my_enums = [x["Name"] for x in self.type_soup.find_all("Member")]
-            if val not in my_enums:
-                raise ValueError("Value {} Enum not found in {}".format(val, my_enums))
+            if not plan.hasEnum(val):
+                raise ValueError("Value {} Enum not found in {}".format(val, list(plan.EnumList)))
         if self.tag_type == "ComplexType":
             if not isinstance(val, dict):
                 raise ValueError("Complex value is not Dict")
-            my_complex = self.createObject().populate(val)
+            # members are populated once, into the parent's RedfishObject, and checked from there
+            return True
         if self.tag_type == "EntityType":
             return True
         my_type, collection = self.parent_type
@@ -606,19 +1370,12 @@ class RedfishType:
                 type_obj = self.owner.parent_doc.catalog.getSchemaDocByClass(my_type).getTypeInSchemaDoc(my_type)
                 return type_obj.validate(val)
             else:
-                enum_annotation = self.type_soup.find('Annotation', attrs={'Term': 'Redfish.Enumeration'}, recursive=False)
-                validPatternAttr = self.type_soup.find('Annotation', attrs={'Term': 'Validation.Pattern'})
-                validMinAttr = self.type_soup.find('Annotation', attrs={'Term': 'Validation.Minimum'})
-                validMaxAttr = self.type_soup.find('Annotation', attrs={'Term': 'Validation.Maximum'})
-                validMin, validMax = int(validMinAttr['Int']) if validMinAttr is not None else None, \
-                    int(validMaxAttr['Int']) if validMaxAttr is not None else None
-                validPattern = validPatternAttr.get('String', '') if validPatternAttr is not None else None
+                validPattern, validMin, validMax, enumPattern = self.getLeafCheck()
                 if added_pattern is not None:
                     validPattern = added_pattern
 
-                if my_type == 'Edm.String' and enum_annotation is not None:
-                    memberList = enum_annotation.find('Collection').find_all('PropertyValue', attrs={'Property': 'Member'})
-                    validPattern = '|'.join([re.escape(x.get('String')) for x in memberList if x.get('String')])
+                if enumPattern is not None:
+                    validPattern = enumPattern
 
                 return RedfishProperty.validate_basic(val, my_type, validPattern, validMin, validMax)
         return True
@@ -627,13 +1384,113 @@ class RedfishType:
         return self.createObj().as_json()
     
     def createObject(self):
-        return RedfishObject(self)
+        return RedfishObject.getPrototype(self)
                 
 
+class LeafResultMemo:
+    """
+    Bounded table of the results of checking primitive values against types.
+
+    Services repeat the same values, such as Status.State "Enabled" or the same timestamps, in every resource;
+    this remembers whether each check passed or the message of the ValueError it raised,
+    dropping the least recently used past maxsize.
+    """
+
+    def __init__(self, maxsize=LEAF_MEMO_SIZE):
+        self.maxsize = maxsize
+        self.results = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    # shared by every memo, so a type keeps a key no other type has when catalog.leaf_memo is swapped
+    _type_keys = itertools.count(1)
+
+    def newTypeKey(self):
+        """
+        Get a key for a type, RedfishTypes aren't hashable
+
+        :return: int, unique within the process
+        """
+        return next(LeafResultMemo._type_keys)
+
+    def check(self, key, compute):
+        """
+        Get the result of a check, running it on first use
+
+        :param key: hashable key of the type and value
+        :param compute: function running the check, returning its result or raising ValueError
+        :raises ValueError: the check failed, now or before
+        :return: result of the check
+        """
+        entry = self.results.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.results.move_to_end(key)
+        else:
+            self.misses += 1
+            try:
+                entry = leafResultTuple(compute(), None)
+            except ValueError as e:
+                entry = leafResultTuple(False, str(e))
+            self.results[key] = entry
+            if len(self.results) > self.maxsize:
+                self.results.popitem(last=False)
+        if entry.error is not None:
+            raise ValueError(entry.error)
+        return entry.result
+
+    def info(self):
+        """
+        Get the hits and size of the memo, as functools.lru_cache's cache_info
+
+        :return: leafMemoInfoTuple
+        """
+        return leafMemoInfoTuple(self.hits, self.misses, self.maxsize, len(self.results))
+
+
+class ValidationPlan:
+    """Validation Plan
+
+    What checking a value against a RedfishType needs, read from its tags once:
+    requirement, nullability, enumeration members and deprecation revisions.
+    Also keeps the display strings of the type for reports.
+    """
+    def __init__(self, redfish_type: RedfishType):
+        self.IsMandatory = redfish_type.IsMandatory
+        self.IsRequired = redfish_type.getAnnotation("Redfish.Required") is not None
+        self.IsNullable = redfish_type.type_attrs.get("Nullable") not in ["false", "False", False]
+        self.Deprecated = redfish_type.Deprecated
+
+        self.EnumList = ()
+        if redfish_type.tag_type == "EnumType":
+            self.EnumList = redfish_type.getEnumMembers()
+        self.Enums = frozenset(self.EnumList)
+
+        # (is deprecated, description or None, version or False) of each Redfish.Revisions record
+        revisions = redfish_type.getRevisions()
+        self.Revisions = list(revisions) if revisions is not None else None
+
+        # display strings by is_collection, filled in by the report
+        self.DisplayTypes = {}
+
+    def hasEnum(self, val):
+        try:
+            return val in self.Enums
+        except TypeError:
+            # unhashable values are never members
+            return False
+
+
 class RedfishProperty(object):
     """Property in a resource
     Represents all Types given, however, ComplexTypes are better suited to be RedfishObjects
+
+    Nodes only hold per-value state in slots; anything derived from the type is read from Type
     """
+    __slots__ = ('Name', 'Type', 'Populated', 'Value', 'IsValid', 'InAnnotation', 'SchemaExists', 'Exists',
+                 'parent', 'added_pattern')
+    _fields = __slots__
+
     def __repr__(self):
         if self.Populated:
             return "{}--{}, Value: {}".format(self.Name, self.Type, self.Value)
@@ -643,7 +1500,6 @@ class RedfishProperty(object):
     def __init__(self, my_type, name="Property", parent=None):
         self.Name = name
         self.Type = my_type
-        self.HasSchema = self.Type != REDFISH_ABSENT
         self.Populated = False
         self.Value = None
         self.IsValid = False # Needs consistency, should be @property 
@@ -653,8 +1509,19 @@ class RedfishProperty(object):
         self.parent = parent
         self.added_pattern = None
 
+    @property
+    def HasSchema(self):
+        return self.Type != REDFISH_ABSENT
+
+    def _copy(self):
+        """Shallow copy of this node, as copy.copy without its overhead"""
+        new = object.__new__(self.__class__)
+        for name in self._fields:
+            setattr(new, name, getattr(self, name))
+        return new
+
     def populate(self, val, check=False):
-        eval_prop = copy.copy(self)
+        eval_prop = self._copy()
         eval_prop.Populated = True
         eval_prop.Value = val
         eval_prop.IsValid = True # Needs consistency, should be @property 
@@ -678,7 +1545,7 @@ class RedfishProperty(object):
         return eval_prop
 
     def as_json(self):
-        my_dict = {x: y for x, y in vars(self).items() if x in ['Name', 'Type', 'Value', 'IsValid', 'Exists', 'SchemaExists']}
+        my_dict = {x: getattr(self, x) for x in ['Name', 'Type', 'Value', 'IsValid', 'Exists', 'SchemaExists']}
         if isinstance(self.Type, RedfishType):
             my_dict['IsRequired'] = self.Type.IsMandatory
             my_dict['IsNullable'] = self.Type.IsNullable
@@ -700,7 +1567,12 @@ class RedfishProperty(object):
                 "Expected string value, got type {}".format(str(type(val)).strip("<>"))
             )
         if pattern is not None:
-            match = re.fullmatch(pattern, val)
+            # patterns are either strings or compiled by a ValidationPlan
+            if isinstance(pattern, re.Pattern):
+                match = pattern.fullmatch(val)
+                pattern = pattern.pattern
+            else:
+                match = re.fullmatch(pattern, val)
             if match is None:
                 raise ValueError(
                     "String '{}' does not match pattern '{}'".format(
@@ -785,6 +1657,59 @@ class RedfishProperty(object):
             return False
 
 
+class LazyProperties(MutableMapping):
+    """
+    Properties of a populated RedfishObject, each populated from the payload when first read,
+    see SchemaCatalog flag 'lazy_populate'
+
+    Checking names doesn't populate anything, so subtrees no check reads, such as skipped Oem objects
+    or absent optional objects, are never populated below their own node.
+    """
+    __slots__ = ('nodes', 'populated', 'payload')
+
+    def __init__(self, properties, payload, skip=()):
+        self.nodes = {x: y for x, y in properties.items() if x not in skip}
+        self.populated = set()
+        self.payload = payload
+
+    def __getitem__(self, key):
+        node = self.nodes[key]
+        if key not in self.populated:
+            node = self.nodes[key] = node.populate(self.payload.get(key, REDFISH_ABSENT))
+            self.populated.add(key)
+        return node
+
+    def __setitem__(self, key, value):
+        self.nodes[key] = value
+        self.populated.add(key)
+
+    def add(self, key, node):
+        """
+        Add an unpopulated node, populated from the payload when first read
+
+        :param key: name in the payload
+        :param node: unpopulated RedfishProperty or RedfishObject
+        """
+        self.nodes[key] = node
+        self.populated.discard(key)
+
+    def __delitem__(self, key):
+        del self.nodes[key]
+        self.populated.discard(key)
+
+    def __contains__(self, key):
+        return key in self.nodes
+
+    def __iter__(self):
+        return iter(self.nodes)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, list(self.nodes))
+
+
 class RedfishObject(RedfishProperty):
     """Represents Redfish as they are represented as Resource/ComplexTypes
 
@@ -793,6 +1718,9 @@ class RedfishObject(RedfishProperty):
     If Populated, can be grabbed for Links
     Can get json representation of type properties with as_json
     """
+    __slots__ = ('payload', 'Collection', 'HasValidUri', 'HasValidUriStrict', 'properties', 'prototypes', 'links')
+    _fields = RedfishProperty._fields + __slots__
+
     def __getitem__(self, index):
         return self.properties[index]
 
@@ -810,6 +1738,10 @@ class RedfishObject(RedfishProperty):
         self.HasValidUri = False
         self.HasValidUriStrict = False
         self.properties = {}
+        # prototypes of objects created below this one, see getPrototype
+        self.prototypes = {}
+        # links collected while populating, see getLinks
+        self.links = None
         for prop, typ in redfish_type.getProperties().items():
             try:
                 base, collection = typ.getBaseType()
@@ -821,7 +1753,102 @@ class RedfishObject(RedfishProperty):
                 self.properties[prop] = RedfishProperty(REDFISH_ABSENT, prop, self)
                 my_logger.warning('Schema not found for {}'.format(typ))
 
+    @staticmethod
+    def getPrototype(redfish_type: RedfishType, name="Object", parent=None):
+        """
+        Get an unpopulated RedfishObject, built once per type, name and parent
+
+        populate never changes the object it is called from, so the tree of unpopulated
+        objects of a type is shared by every resource using it.
+        Only objects of properties declared by the parent are kept, so additional properties
+        and annotations with arbitrary names can't grow the tree; those, and objects below a
+        populated parent, are built on every call
+
+        :param redfish_type: RedfishType of the object
+        :param name: name of the object
+        :param parent: unpopulated RedfishObject holding the object, or None
+        :return: RedfishObject
+        """
+        if parent is None:
+            return redfish_type._memo(('prototype', name), lambda: RedfishObject(redfish_type, name))
+        if parent.Populated or name not in parent.properties:
+            return RedfishObject(redfish_type, name, parent)
+        # RedfishType is not hashable, key by identity and keep the type alive with its object
+        key = (id(redfish_type), name)
+        if key not in parent.prototypes:
+            parent.prototypes[key] = (redfish_type, RedfishObject(redfish_type, name, parent))
+        return parent.prototypes[key][1]
+
     def populate(self, payload, check=False, casted=False):
+        if self.Type.catalog.flags['iterative_populate']:
+            return RedfishObject.runPopulate(self._populateSteps(payload, check, casted))
+        # populate the objects below us as they're asked for
+        steps = self._populateSteps(payload, check, casted)
+        result, error = None, None
+        while True:
+            try:
+                child, value, child_check, child_casted = steps.send(result) if error is None else steps.throw(error)
+            except StopIteration as e:
+                return e.value
+            result, error = None, None
+            try:
+                result = child.populate(value, check=child_check, casted=child_casted)
+            except Exception as e:
+                error = e
+
+    @staticmethod
+    def runPopulate(steps):
+        """
+        Run populate steps on a work stack instead of the call stack, see SchemaCatalog flag 'iterative_populate'
+
+        Each object below yields to this loop instead of recursing, so nesting costs no Python frames
+        and no depth is too deep; the populated tree is the same.
+
+        :param steps: generator of RedfishObject._populateSteps
+        :return: populated RedfishObject
+        """
+        stack = [steps]
+        result, error = None, None
+        while stack:
+            try:
+                request = stack[-1].send(result) if error is None else stack[-1].throw(error)
+            except StopIteration as e:
+                stack.pop()
+                result, error = e.value, None
+                continue
+            except Exception as e:
+                stack.pop()
+                if not stack:
+                    raise
+                result, error = None, e
+                continue
+            child, value, child_check, child_casted = request
+            stack.append(child._populateSteps(value, child_check, child_casted))
+            result, error = None, None
+        return result
+
+    def _populateProperties(self, payload, skip=()):
+        # populate our properties from a dict payload, yielding the objects among them
+        properties = self.properties
+        if self.Type.catalog.flags['lazy_populate']:
+            return LazyProperties(properties, payload, skip)
+        populated = {}
+        for x, y in properties.items():
+            if x in skip:
+                continue
+            if isinstance(y, RedfishObject):
+                populated[x] = yield (y, payload.get(x, REDFISH_ABSENT), False, False)
+            else:
+                populated[x] = y.populate(payload.get(x, REDFISH_ABSENT))
+        return populated
+
+    def _populateSteps(self, payload, check=False, casted=False):
+        """
+        Populate this object, as a generator yielding (object, payload, check, casted) for each object below it,
+        and being sent back the populated object
+
+        :return: populated RedfishObject, as the generator's value
+        """
         eval_obj = super().populate(payload)
         eval_obj.payload = payload
 
@@ -832,12 +1859,12 @@ class RedfishObject(RedfishProperty):
         if payload == REDFISH_ABSENT or payload is None:
             eval_obj.Collection = []
             if payload is None:
-                sub_obj = copy.copy(eval_obj)
+                sub_obj = eval_obj._copy()
                 eval_obj.Collection = [sub_obj]
             eval_obj.IsValid = eval_obj.Type.IsNullable
             eval_obj.HasValidUri = True
             eval_obj.HasValidUriStrict = False
-            eval_obj.properties = {x:y.populate(REDFISH_ABSENT) for x, y in eval_obj.properties.items()}
+            eval_obj.properties = yield from eval_obj._populateProperties({})
             return eval_obj
 
         # Representation for Complexes as Collection, unless it is not a list
@@ -850,7 +1877,7 @@ class RedfishObject(RedfishProperty):
             if sub_payload is None:
                 # If the object is null, treat it as an empty object for the cataloging
                 sub_payload = {}
-            sub_obj = copy.copy(eval_obj)
+            sub_obj = eval_obj._copy()
 
             # Only valid if we are a dictionary...
             # todo: see above None/REDFISH_ABSENT block
@@ -860,7 +1887,7 @@ class RedfishObject(RedfishProperty):
                 sub_obj.Collection = []
                 sub_obj.HasValidUri = True
                 sub_obj.HasValidUriStrict = False
-                sub_obj.properties = {x:y.populate(REDFISH_ABSENT) for x, y in sub_obj.properties.items()}
+                sub_obj.properties = yield from sub_obj._populateProperties({})
                 evals.append(sub_obj)
                 continue
 
@@ -874,17 +1901,22 @@ class RedfishObject(RedfishProperty):
                 already_typed = True
 
             # If our item is an OemObject type and hasn't been casted to a type, then cast it
-            if 'Resource.OemObject' in sub_obj.Type.getTypeTree() and not casted:
+            if sub_obj.Type.isA('Resource.OemObject') and not casted:
                 my_logger.verbose1(('Morphing OemObject', my_odata_type, sub_obj.Type))
                 if my_odata_type:
-                    my_odata_type = my_odata_type.strip('#')
-                    try:
-                        type_obj = sub_obj.Type.catalog.getSchemaDocByClass(my_odata_type).getTypeInSchemaDoc(my_odata_type)
-                        sub_obj = RedfishObject(type_obj, sub_obj.Name, sub_obj.parent).populate(sub_payload, check=check, casted=True)
-                    except MissingSchemaError:
+                    my_odata_type = getTypeName(my_odata_type.strip('#'))
+                    type_obj, error = sub_obj.Type.catalog.resolve('type', my_odata_type)
+                    if isinstance(error, MissingSchemaError):
                         my_logger.warning("Couldn't get schema for object, skipping OemObject {}".format(sub_obj.Name))
-                    except Exception as e:
-                        my_logger.warning("Couldn't get schema for object (?), skipping OemObject {} : {}".format(sub_obj.Name, e))
+                    elif error is not None:
+                        my_logger.warning("Couldn't get schema for object (?), skipping OemObject {} : {}".format(sub_obj.Name, error))
+                    else:
+                        try:
+                            sub_obj = yield (RedfishObject.getPrototype(type_obj, sub_obj.Name, sub_obj.parent), sub_payload, check, True)
+                        except MissingSchemaError:
+                            my_logger.warning("Couldn't get schema for object, skipping OemObject {}".format(sub_obj.Name))
+                        except Exception as e:
+                            my_logger.warning("Couldn't get schema for object (?), skipping OemObject {} : {}".format(sub_obj.Name, e))
                     evals.append(sub_obj)
                     continue
             # Otherwise, if we're not casted, or we don't have an odata type, then cast it
@@ -892,7 +1924,7 @@ class RedfishObject(RedfishProperty):
                 my_ns, my_ns_unversioned = sub_obj.Type.Namespace, getNamespaceUnversioned(sub_obj.Type.Namespace)
                 # if we have an odata type, use it as our upper limit
                 if my_odata_type:
-                    my_limit = getNamespace(my_odata_type).strip('#')
+                    my_limit = getNamespace(getTypeName(my_odata_type)).strip('#')
                 else:
                     my_limit = 'v9_9_9'
                 # If our item is not a Resource.Resource type, determine its parent's version limit for later...
@@ -904,21 +1936,20 @@ class RedfishObject(RedfishProperty):
                         parent = parent.parent
                         my_limit = parent.Type.Namespace
                 my_type = sub_obj.Type.Type
-                top_ns = my_ns
-                # get type order from bottom up of SchemaDoc
-                for top_ns, schema in reversed(list(sub_obj.Type.catalog.getSchemaDocByClass(my_ns).classes.items())):
-                    # if our object type is in schema... check for limit
-                    if my_type in schema.my_types:
-                        if splitVersionString(top_ns) <= splitVersionString(my_limit):
-                            my_ns = top_ns
-                            break
+                # get the last namespace of our SchemaDoc with our object type, within our limit
+                my_doc = sub_obj.Type.catalog.getSchemaDocByClass(my_ns)
+                top_ns = my_doc.getCastNamespace(my_type, my_limit)
+                if top_ns is not None:
+                    my_ns = top_ns
+                else:
+                    top_ns = next(iter(my_doc.classes), my_ns)
                 # ISSUE: We can't cast under v1_0_0, get the next best Type
                 if my_ns == my_ns_unversioned:
                     my_ns = top_ns
                 if my_ns not in sub_obj.Type.Namespace:
                     my_logger.verbose1(('Morphing Complex', my_ns, my_type, my_limit))
                     new_type_obj = sub_obj.Type.catalog.getSchemaDocByClass(my_ns).getTypeInSchemaDoc('.'.join([my_ns, my_type]))
-                    sub_obj = RedfishObject(new_type_obj, sub_obj.Name, sub_obj.parent).populate(sub_payload, check=check, casted=True)
+                    sub_obj = yield (RedfishObject.getPrototype(new_type_obj, sub_obj.Name, sub_obj.parent), sub_payload, check, True)
                     evals.append(sub_obj)
                     continue
 
@@ -936,16 +1967,14 @@ class RedfishObject(RedfishProperty):
                     my_odata_id = my_odata_id.rstrip('/')
 
                 # Initial check if our URI matches our format at all
-                # Setup REGEX...
-                my_uri_regex = "^{}$".format("|".join(allowable_uris))
-                my_uri_regex = re.sub(URI_ID_REGEX, VALID_ID_REGEX, my_uri_regex)
-                sub_obj.HasValidUri = re.fullmatch(my_uri_regex, my_odata_id) is not None
+                uri_match = sub_obj.Type.getUriMatcher().match(my_odata_id)
+                sub_obj.HasValidUri = uri_match is not None
                 sub_obj.HasValidUriStrict = sub_obj.HasValidUri
 
-                if 'Resource.Resource' in sub_obj.Type.getTypeTree():
+                if sub_obj.Type.isA('Resource.Resource'):
                     if '#' in my_odata_id:
                         my_logger.warning('Found uri with fragment, which Resource.Resource types do not use {}'.format(my_odata_id))
-                elif 'Resource.ReferenceableMember' in sub_obj.Type.getTypeTree():
+                elif sub_obj.Type.isA('Resource.ReferenceableMember'):
                     if '#' not in my_odata_id:
                         my_logger.warning('No fragment in URI, but ReferenceableMembers require it {}'.format(my_odata_id))
 
@@ -956,17 +1985,10 @@ class RedfishObject(RedfishProperty):
                     my_odata_split = my_odata_id.split('/')
                     my_type, my_id, my_uri_id = sub_obj.Type.Type, sub_payload.get('Id'), my_odata_split[-1]
 
-                    for schema_uri in allowable_uris:
-                        # regex URI check to confirm which URI 
-                        my_uri_regex = re.sub(URI_ID_REGEX, VALID_ID_REGEX, "^{}$".format(schema_uri))
-                        if re.fullmatch(my_uri_regex, my_odata_id):
-                            # pair our uri with the current resource
-                            schema_uri_end = schema_uri.rsplit('/')[-1]
-                            # if our Uri is expecting an Id, then check if they match, otherwise we are already passing
-                            if re.match(URI_ID_REGEX, schema_uri_end):
-                                if my_id is not None:
-                                    sub_obj.HasValidUriStrict = my_id == my_uri_id
-                            break
+                    # if the Uri we matched is expecting an Id, then check if they match, otherwise we are already passing
+                    if uri_match.EndsWithId:
+                        if my_id is not None:
+                            sub_obj.HasValidUriStrict = my_id == my_uri_id
 
             # TODO: Oem support is able, but it is tempermental for Actions and Additional properties
             #if 'Resource.OemObject' in sub_obj.Type.getTypeTree():
@@ -975,37 +1997,30 @@ class RedfishObject(RedfishProperty):
 
             # populate properties
             if sub_obj.Name == 'Actions':
-                sub_obj.properties = {x:y.populate(sub_payload.get(x, REDFISH_ABSENT)) for x, y in sub_obj.properties.items() if x != 'Oem'}
+                sub_obj.properties = yield from sub_obj._populateProperties(sub_payload, skip=('Oem',))
             else:
-                sub_obj.properties = {x:y.populate(sub_payload.get(x, REDFISH_ABSENT)) for x, y in sub_obj.properties.items()}
+                sub_obj.properties = yield from sub_obj._populateProperties(sub_payload)
 
             # additional_props
-            if sub_obj.Type.DynamicProperties:
-                my_dynamic = sub_obj.Type.DynamicProperties
-                my_odata_type = my_dynamic.get('Type', 'Resource.OemObject')
-                prop_pattern = my_dynamic.get('Pattern', '.*')
-                allow_property_generation = sub_obj.Name != 'Actions'
-            else:
-                my_odata_type = 'Resource.OemObject'
-                prop_pattern = '.*'
-                allow_property_generation = sub_obj.Type.HasAdditional and sub_obj.Name != 'Actions'
+            my_odata_type, prop_pattern, allow_property_generation = sub_obj.Type.getAdditionalRule()
+            allow_property_generation = allow_property_generation and sub_obj.Name != 'Actions'
 
             if allow_property_generation:
                 my_property_names = [x for x in sub_payload if x not in sub_obj.properties if re.match(prop_pattern, x) and '@' not in x]
                 for add_name in my_property_names:
-                    if 'Edm.' in my_odata_type:
-                        my_new_term = '<Term Name="{}" Type="{}"> </Term>'.format(add_name, my_odata_type) # Make a pseudo tag because RedfishType requires it...
-                        new_soup = BeautifulSoup(my_new_term, "xml").find('Term')
-                        type_obj = RedfishType(new_soup, sub_obj.Type.owner)
-                    else:
-                        type_obj = sub_obj.Type.catalog.getSchemaDocByClass(my_odata_type).getTypeInSchemaDoc(my_odata_type)
+                    type_obj = sub_obj.Type.getAdditionalType(my_odata_type)
                     if type_obj.getBaseType()[0] == 'complex':
-                        object = RedfishObject(type_obj, name=add_name, parent=self)
+                        object = RedfishObject.getPrototype(type_obj, name=add_name, parent=self)
                     else:
                         object = RedfishProperty(type_obj, name=add_name, parent=self)
                     my_logger.debug('Populated {} with {}'.format(my_property_names, object.as_json()))
                     my_logger.verbose1(('Adding Additional', add_name, my_odata_type, sub_obj.Type))
-                    sub_obj.properties[add_name] = object.populate(sub_payload.get(add_name, REDFISH_ABSENT))
+                    if isinstance(sub_obj.properties, LazyProperties):
+                        sub_obj.properties.add(add_name, object)
+                    elif isinstance(object, RedfishObject):
+                        sub_obj.properties[add_name] = yield (object, sub_payload.get(add_name, REDFISH_ABSENT), False, False)
+                    else:
+                        sub_obj.properties[add_name] = object.populate(sub_payload.get(add_name, REDFISH_ABSENT))
 
             my_annotations = [x for x in sub_payload if x not in sub_obj.properties if '@' in x and '@odata' not in x]
             for key in my_annotations:
@@ -1014,17 +2029,29 @@ class RedfishObject(RedfishProperty):
                 if getNamespace(fullItem) not in allowed_annotations:
                     my_logger.warning("getAnnotations: {} is not an allowed annotation namespace, please check spelling/capitalization.".format(fullItem))
                     continue
+                type_obj, error = sub_obj.Type.catalog.resolve('term', fullItem)
+                if error is not None:
+                    my_logger.error("Unable to locate the definition of the annotation '@{}'.".format(fullItem))
+                    continue
                 try:
-                    type_obj = sub_obj.Type.catalog.getSchemaInCatalog(fullItem).terms[getType(fullItem)]
                     if type_obj.getBaseType()[0] == 'complex':
-                        object = RedfishObject(type_obj, name=key, parent=self)
+                        object = RedfishObject.getPrototype(type_obj, name=key, parent=self)
                     else:
                         object = RedfishProperty(type_obj, name=key, parent=self)
                     my_logger.verbose1(('Adding Additional', key, my_odata_type, sub_obj.Type))
-                    sub_obj.properties[key] = object.populate(sub_payload[key])
+                    if isinstance(object, RedfishObject):
+                        sub_obj.properties[key] = yield (object, sub_payload[key], False, False)
+                    else:
+                        sub_obj.properties[key] = object.populate(sub_payload[key])
                 except:
                     my_logger.error("Unable to locate the definition of the annotation '@{}'.".format(fullItem))
 
+            # our objects below already hold their links, so collecting ours only looks at our properties
+            if not isinstance(sub_obj.properties, LazyProperties):
+                try:
+                    sub_obj.links = sub_obj._collectLinks()
+                except MissingSchemaError:
+                    sub_obj.links = None
             evals.append(sub_obj)
         if not isinstance(payload, list):
             sub_obj.Collection = evals
@@ -1050,8 +2077,16 @@ class RedfishObject(RedfishProperty):
             return base
 
     def getLinks(self):
-        """Grab links from our Object
         """
+        Grab links from our Object, collected when it was populated where possible
+
+        :return: list of linkRecordTuple
+        """
+        if self.links is not None:
+            return list(self.links)
+        return self._collectLinks()
+
+    def _collectLinks(self):
         links = []
         # if we're populated...
         if self.Populated:
@@ -1065,24 +2100,17 @@ class RedfishObject(RedfishProperty):
                         if isinstance(act, dict):
                             uri = act.get('@Redfish.ActionInfo')
                             if isinstance(uri, str):
-                                my_link = RedfishObject(new_type, 'ActionInfo', item).populate({'@odata.id': uri})
-                                my_link.InAnnotation = True
-                                links.append(my_link)
+                                links.append(linkRecordTuple('ActionInfo', {'@odata.id': uri}, new_type, True, item))
                 if item.Type.IsNav:
                     if isinstance(item.Value, list):
                         for num, val in enumerate(item.Value):
-                            new_link = item.populate(val)
-                            new_link.Name = new_link.Name + '#{}'.format(num)
-                            links.append(new_link)
+                            links.append(linkRecordTuple(item.Name + '#{}'.format(num), val, item.Type, False, item.parent))
                     else:
-                        links.append(item)
+                        links.append(linkRecordTuple(item.Name, item.Value, item.Type, item.InAnnotation, item.parent))
                 elif item.Type.getBaseType()[0] == 'complex':
                     for sub in item.Collection:
                         if sub.Value is None:
                             continue
                         InAnnotation = sub.Name in ['@Redfish.Settings', '@Redfish.ActionInfo', '@Redfish.CollectionCapabilities']
-                        my_links = sub.getLinks()
-                        for item in my_links:
-                            item.InAnnotation = InAnnotation
-                        links.extend(my_links)
+                        links.extend(x._replace(InAnnotation=InAnnotation) for x in sub.getLinks())
         return links
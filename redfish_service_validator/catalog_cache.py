@@ -0,0 +1,177 @@
+# Copyright Notice:
+# Copyright 2026 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Validator/blob/master/LICENSE.md
+
+import glob
+import hashlib
+import logging
+import os
+import pickle
+
+my_logger = logging.getLogger(__name__)
+
+# Directory, relative to the schema directory, holding compiled schema documents
+CACHE_DIRNAME = '.catalog_cache'
+
+# Bump when the stored representation of a schema document changes
+SNAPSHOT_VERSION = 2
+
+# File, inside the snapshot directory, holding the header of every indexed document
+INDEX_FILENAME = 'index.pickle'
+
+
+def hash_schema_data(data):
+    """
+    Content hash of a schema file, used as its snapshot key
+
+    :param data: contents of the schema file
+    :type data: str
+    :return: hex digest
+    """
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+class CatalogSnapshot:
+    """
+    Compiled snapshot of a schema directory.
+
+    Stores the parsed tree of each schema document under the hash of its content
+    and the loader that parsed it, so unchanged documents are loaded without parsing
+    any XML, and an index of document headers, so the catalog can be indexed without
+    even scanning them.
+    """
+
+    def __init__(self, directory, loader=''):
+        self.directory = directory
+        self.loader = loader
+        self.enabled = True
+        self.used = set()
+        self._headers = None
+        self._headers_changed = False
+
+    def _entry_path(self, digest):
+        return os.path.join(self.directory, '{}.{}.pickle'.format(digest, self.loader))
+
+    def _load_headers(self):
+        if self._headers is None:
+            self._headers = {}
+            try:
+                with open(os.path.join(self.directory, INDEX_FILENAME), 'rb') as f:
+                    version, headers = pickle.load(f)
+                if version == SNAPSHOT_VERSION:
+                    self._headers = headers
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                my_logger.debug('Could not read catalog snapshot index: {}'.format(repr(e)))
+        return self._headers
+
+    def load_header(self, digest):
+        """
+        Get the header stored for a content hash
+
+        :param digest: content hash of the schema file
+        :return: header tuple, or None if not stored
+        """
+        self.used.add(digest)
+        if not self.enabled:
+            return None
+        return self._load_headers().get(digest)
+
+    def store_header(self, digest, header):
+        """
+        Store the header for a content hash, written out on prune
+
+        :param digest: content hash of the schema file
+        :param header: header tuple, as given by scan_csdl_header
+        """
+        self.used.add(digest)
+        if not self.enabled:
+            return
+        headers = self._load_headers()
+        if headers.get(digest) != header:
+            headers[digest] = header
+            self._headers_changed = True
+
+    def contains(self, digest):
+        """
+        Whether a parsed document is stored for a content hash
+
+        :param digest: content hash of the schema file
+        :return: bool
+        """
+        return self.enabled and os.path.exists(self._entry_path(digest))
+
+    def load(self, digest):
+        """
+        Get the parsed document stored for a content hash
+
+        :param digest: content hash of the schema file
+        :return: document CsdlElement, or None if not stored
+        """
+        self.used.add(digest)
+        if not self.enabled:
+            return None
+        try:
+            with open(self._entry_path(digest), 'rb') as f:
+                version, tree = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            my_logger.debug('Could not read catalog snapshot entry {}: {}'.format(digest, repr(e)))
+            return None
+        return tree if version == SNAPSHOT_VERSION else None
+
+    def store(self, digest, tree):
+        """
+        Store the parsed document for a content hash
+
+        :param digest: content hash of the schema file
+        :param tree: document CsdlElement
+        """
+        self.used.add(digest)
+        if not self.enabled:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = self._entry_path(digest) + '.{}.tmp'.format(os.getpid())
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((SNAPSHOT_VERSION, tree), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._entry_path(digest))
+        except Exception as e:
+            my_logger.debug('Could not write catalog snapshot to {}, disabling it: {}'.format(self.directory, repr(e)))
+            self.enabled = False
+
+    def prune(self):
+        """
+        Remove entries of documents that are no longer in the schema directory, and write out the header index
+        """
+        if not self.enabled:
+            return
+        headers = self._load_headers()
+        for digest in [x for x in headers if x not in self.used]:
+            del headers[digest]
+            self._headers_changed = True
+        if self._headers_changed:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                index_path = os.path.join(self.directory, INDEX_FILENAME)
+                tmp_path = index_path + '.{}.tmp'.format(os.getpid())
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump((SNAPSHOT_VERSION, headers), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, index_path)
+                self._headers_changed = False
+            except Exception as e:
+                my_logger.debug('Could not write catalog snapshot to {}, disabling it: {}'.format(self.directory, repr(e)))
+                self.enabled = False
+                return
+        for entry in glob.glob(os.path.join(self.directory, '*.pickle')):
+            if entry == os.path.join(self.directory, INDEX_FILENAME):
+                continue
+            # entries are named digest.loader.pickle, anything else is from an older layout
+            parts = os.path.basename(entry).split('.')
+            if len(parts) != 3 or parts[0] not in self.used:
+                try:
+                    os.remove(entry)
+                except OSError:
+                    pass
@@ -0,0 +1,121 @@
+# Copyright Notice:
+# Copyright 2026 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Validator/blob/master/LICENSE.md
+
+"""
+Precompiled validators
+
+Builds one straight-line check per property of an Edm, enumeration or TypeDefinition type,
+following RedfishType.validate, as a closure over the type's ValidationPlan and leaf check.
+No source text is produced, so nothing read from a schema is ever executed.
+Checks are used instead of interpreting the schema when SchemaCatalog.flags['generated_validators'] is set.
+"""
+
+import logging
+import re
+
+from redfish_service_validator.catalog import REDFISH_ABSENT, MissingSchemaError, RedfishProperty
+
+my_logger = logging.getLogger(__name__)
+
+INT_TYPES = ["Edm.Int16", "Edm.Int32", "Edm.Int64", "Edm.Int"]
+
+
+def _leaf_check(my_type, edm_type, accepts_pattern):
+    # check of a value against a type built on an Edm type, as RedfishType.validate does
+    validPattern, validMin, validMax, enumPattern = my_type.getLeafCheck()
+    # a Redfish.Enumeration pattern can't be replaced, nor can the pattern of a type below the property
+    fixed_pattern = enumPattern if enumPattern is not None else validPattern
+    use_added = enumPattern is None and accepts_pattern
+
+    if edm_type == 'Edm.String':
+        def check(val, added_pattern):
+            return RedfishProperty.validate_string(val, added_pattern if use_added and added_pattern is not None else fixed_pattern)
+    elif edm_type in INT_TYPES:
+        def check(val, added_pattern):
+            if not isinstance(val, int):
+                raise ValueError("Expected int, got type {}".format(str(type(val)).strip("<>")))
+            return RedfishProperty.validate_number(val, validMin, validMax)
+    else:
+        def check(val, added_pattern):
+            pattern = added_pattern if use_added and added_pattern is not None else fixed_pattern
+            return RedfishProperty.validate_basic(val, edm_type, pattern, validMin, validMax)
+    return check
+
+
+def _value_check(prop_type):
+    # check of a value that is neither absent nor null, or None if the property needs the interpreter
+    my_type, _ = prop_type.parent_type
+    if my_type is None:
+        return lambda val, added_pattern: True
+    if 'Edm.' in my_type:
+        return _leaf_check(prop_type, my_type, True)
+
+    type_obj = prop_type.catalog.getSchemaDocByClass(my_type).getTypeInSchemaDoc(my_type)
+    base_type, _ = type_obj.parent_type
+    if type_obj.tag_type == "EnumType":
+        enum_plan = type_obj.getValidationPlan()
+        enum_list = list(enum_plan.EnumList)
+        if base_type is None:
+            base_check = None
+        elif 'Edm.' in base_type:
+            base_check = _leaf_check(type_obj, base_type, False)
+        else:
+            return None
+
+        def check(val, added_pattern):
+            if not enum_plan.hasEnum(val):
+                raise ValueError("Value {} Enum not found in {}".format(val, enum_list))
+            return base_check(val, added_pattern) if base_check is not None else True
+        return check
+    if type_obj.tag_type == "TypeDefinition" and base_type is not None and 'Edm.' in base_type:
+        return _leaf_check(type_obj, base_type, False)
+    return None
+
+
+def build_property_check(prop_type):
+    """
+    Build the check of a property type
+
+    :param prop_type: RedfishType of a Property or NavigationProperty
+    :return: function(val, added_pattern=None), or None if it is checked by the interpreter (objects, links, deeper type chains)
+    """
+    try:
+        value_check = _value_check(prop_type)
+    except (MissingSchemaError, KeyError, ValueError, re.error) as e:
+        my_logger.debug('Not building a check for {}: {}'.format(prop_type, repr(e)))
+        return None
+    if value_check is None:
+        return None
+    plan = prop_type.getValidationPlan()
+    is_required, is_nullable = plan.IsRequired, plan.IsNullable
+
+    def check(val, added_pattern=None):
+        if val == REDFISH_ABSENT:
+            if is_required:
+                raise ValueError("Should not be absent")
+            return True
+        if val is None:
+            if is_nullable:
+                return True
+            raise ValueError("Should not be null")
+        return value_check(val, added_pattern)
+    return check
+
+
+class GeneratedValidators:
+    """
+    Precompiled validators of a catalog, built on first use of each property type
+    """
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+
+    def getPropertyCheck(self, prop_type):
+        """
+        Get the precompiled check of a property type
+
+        :param prop_type: RedfishType of a Property or NavigationProperty
+        :return: function(val, added_pattern=None), or None if it is checked by the interpreter
+        """
+        return prop_type._memo('generated_check', lambda: build_property_check(prop_type))
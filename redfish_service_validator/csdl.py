@@ -0,0 +1,276 @@
+# Copyright Notice:
+# Copyright 2026 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Validator/blob/master/LICENSE.md
+
+import logging
+from io import BytesIO
+
+from bs4 import BeautifulSoup, NavigableString, Comment
+from lxml import etree
+
+my_logger = logging.getLogger(__name__)
+
+XML_NAMESPACE = 'http://www.w3.org/XML/1998/namespace'
+
+_ASCII_SPACES = {ord(x): None for x in '\x20\x0a\x09\x0c\x0d'}
+
+
+class CsdlElement:
+    """
+    Lightweight, picklable element of a CSDL document.
+
+    Supports the subset of the BeautifulSoup Tag interface used by the catalog
+    (name, attrs, get, [], find, find_all, contents), so catalog objects can be
+    built from a freshly parsed document or from a stored snapshot alike.
+    """
+    __slots__ = ('name', 'attrs', 'children', 'text')
+
+    def __init__(self, name, attrs=None, children=None, text=None):
+        self.name = name
+        self.attrs = attrs if attrs is not None else {}
+        self.children = children if children is not None else []
+        self.text = text
+
+    def __reduce__(self):
+        return (CsdlElement, (self.name, self.attrs, self.children, self.text))
+
+    def __repr__(self):
+        return '<{} {}>'.format(self.name, ' '.join('{}="{}"'.format(x, y) for x, y in self.attrs.items())).replace(' >', '>')
+
+    def __getitem__(self, key):
+        return self.attrs[key]
+
+    def get(self, key, default=None):
+        return self.attrs.get(key, default)
+
+    @property
+    def contents(self):
+        return [self.text] if self.text else []
+
+    def _matches(self, name, attrs):
+        if name is not None:
+            if isinstance(name, str):
+                if self.name != name:
+                    return False
+            elif self.name not in name:
+                return False
+        for key, value in attrs.items():
+            if self.attrs.get(key) != value:
+                return False
+        return True
+
+    def _iter_descendants(self):
+        stack = list(reversed(self.children))
+        while stack:
+            element = stack.pop()
+            yield element
+            stack.extend(reversed(element.children))
+
+    def find_all(self, name=None, attrs={}, recursive=True, **kwargs):
+        """
+        Find all child elements matching a tag name (or list of names) and attribute values
+
+        :param name: tag name or list of tag names, None for any
+        :param attrs: dictionary of attribute values to match
+        :param recursive: search all descendants instead of only direct children
+        :return: list of CsdlElement
+        """
+        if kwargs:
+            attrs = {**attrs, **kwargs}
+        if not recursive and not attrs:
+            if name is None:
+                return list(self.children)
+            if isinstance(name, str):
+                return [x for x in self.children if x.name == name]
+            return [x for x in self.children if x.name in name]
+        candidates = self._iter_descendants() if recursive else self.children
+        return [x for x in candidates if x._matches(name, attrs)]
+
+    def find(self, name=None, attrs={}, recursive=True, **kwargs):
+        """
+        Find first child element matching a tag name (or list of names) and attribute values
+
+        :return: CsdlElement or None
+        """
+        if kwargs:
+            attrs = {**attrs, **kwargs}
+        candidates = self._iter_descendants() if recursive else self.children
+        for x in candidates:
+            if x._matches(name, attrs):
+                return x
+        return None
+
+
+class CsdlAnnotation:
+    """
+    Plain form of an Annotation element, holding what the catalog reads from one.
+
+    Keeps the attributes of the Annotation, those of every PropertyValue within it in document order,
+    and the text of every String within it, so the element's subtree can be dropped.
+    Reads attributes like CsdlElement, with get and [].
+    """
+    __slots__ = ('attrs', 'property_values', 'strings')
+
+    def __init__(self, attrs, property_values=(), strings=()):
+        self.attrs = attrs
+        self.property_values = property_values
+        self.strings = strings
+
+    @classmethod
+    def from_element(cls, element):
+        """
+        :param element: Annotation CsdlElement
+        :return: CsdlAnnotation
+        """
+        return cls(element.attrs,
+                   tuple(x.attrs for x in element.find_all('PropertyValue')),
+                   tuple(x.text for x in element.find_all('String') if x.text))
+
+    def __repr__(self):
+        return '<Annotation {}>'.format(' '.join('{}="{}"'.format(x, y) for x, y in self.attrs.items()))
+
+    def __getitem__(self, key):
+        return self.attrs[key]
+
+    def get(self, key, default=None):
+        return self.attrs.get(key, default)
+
+    def getPropertyValue(self, name):
+        """
+        Get the attributes of the first PropertyValue with this Property, or None
+        """
+        for x in self.property_values:
+            if x.get('Property') == name:
+                return x
+        return None
+
+
+def _element_from_tag(tag):
+    text = None
+    if len(tag.contents) and isinstance(tag.contents[0], NavigableString) and not isinstance(tag.contents[0], Comment):
+        text = str(tag.contents[0])
+    attrs = {str(x): str(y) for x, y in tag.attrs.items()}
+    children = [_element_from_tag(x) for x in tag.find_all(recursive=False)]
+    return CsdlElement(tag.name, attrs, children, text)
+
+
+def parse_csdl_soup(data):
+    """
+    Parse CSDL text into a tree of CsdlElement, using BeautifulSoup
+
+    :param data: CSDL document as a string
+    :return: document CsdlElement, whose children are the top level tags
+    """
+    soup = BeautifulSoup(data, "xml")
+    return CsdlElement('[document]', {}, [_element_from_tag(x) for x in soup.find_all(recursive=False)])
+
+
+def _attribute_name(key, nsmap):
+    # present namespaced attributes as prefix:name, as BeautifulSoup does
+    if not key.startswith('{'):
+        return key
+    uri, name = key[1:].split('}', 1)
+    if uri == XML_NAMESPACE:
+        return 'xml:' + name
+    for prefix, ns_uri in nsmap.items():
+        if ns_uri == uri and prefix is not None:
+            return prefix + ':' + name
+    return name
+
+
+def _element_text(text):
+    # collapse whitespace-only text to a single character, as BeautifulSoup does
+    if text is not None and text.translate(_ASCII_SPACES) == '':
+        return '\n' if '\n' in text else ' '
+    return text
+
+
+def parse_csdl_lxml(data):
+    """
+    Parse CSDL text into a tree of CsdlElement, using lxml iterparse
+
+    Produces the same tree as parse_csdl_soup, including namespace declarations as attributes
+
+    :param data: CSDL document as a string
+    :return: document CsdlElement, whose children are the top level tags
+    """
+    document = CsdlElement('[document]')
+    stack = [document]
+    new_namespaces = {}
+    for event, item in etree.iterparse(BytesIO(data.encode('utf-8')), events=('start-ns', 'start', 'end'), encoding='utf-8', recover=True):
+        if event == 'start-ns':
+            prefix, uri = item
+            new_namespaces['xmlns:' + prefix if prefix else 'xmlns'] = uri
+        elif event == 'start':
+            attrs = {_attribute_name(x, item.nsmap): y for x, y in item.attrib.items()}
+            attrs.update(new_namespaces)
+            new_namespaces = {}
+            element = CsdlElement(etree.QName(item).localname, attrs)
+            stack[-1].children.append(element)
+            stack.append(element)
+        else:
+            element = stack.pop()
+            element.text = _element_text(item.text)
+            item.clear(keep_tail=True)
+    return document
+
+
+def _local_name(item):
+    return etree.QName(item).localname if item is not None else None
+
+
+def scan_csdl_header(data):
+    """
+    Cheaply scan CSDL text for the namespaces it defines, the aliases it references and its URI templates
+
+    Only the Reference, Include, Schema and Annotation tags are looked at, no document tree is built;
+    the results are the same as the refs/alias and classes a SchemaDoc finds
+
+    :param data: CSDL document as a string
+    :return: tuple of (Schema namespaces, (alias, namespace) pairs, (type, Redfish.Uris templates) pairs), each in document order
+    """
+    namespaces, aliases, uris = [], [], []
+    context = etree.iterparse(BytesIO(data.encode('utf-8')), events=('end',), encoding='utf-8', recover=True,
+                              tag=('{*}Reference', '{*}Include', '{*}Schema', '{*}Annotation'))
+    for _, item in context:
+        parent = item.getparent()
+        name = _local_name(item)
+        if name == 'Annotation':
+            # Uris of an EntityType or ComplexType defined in a Schema
+            if item.get('Term') == 'Redfish.Uris' and _local_name(parent) in ['EntityType', 'ComplexType'] \
+                    and _local_name(parent.getparent()) == 'Schema' and parent.get('Name') is not None:
+                templates = [x.text for collection in item if _local_name(collection) == 'Collection'
+                             for x in collection if _local_name(x) == 'String' and x.text]
+                uris.append(('{}.{}'.format(parent.getparent().get('Namespace'), parent.get('Name')), tuple(templates)))
+        elif name == 'Schema':
+            if _local_name(parent) == 'DataServices' and _local_name(parent.getparent()) == 'Edmx' \
+                    and parent.getparent().getparent() is None and item.get('Namespace') is not None:
+                namespaces.append(item.get('Namespace'))
+        elif name == 'Include':
+            if _local_name(parent) == 'Reference' and _local_name(parent.getparent()) == 'Edmx' \
+                    and parent.getparent().getparent() is None:
+                ns, alias, uri = item.get('Namespace'), item.get('Alias'), parent.get('Uri')
+                if ns is not None and uri is not None and alias is not None:
+                    aliases.append((alias, ns))
+    return tuple(dict.fromkeys(namespaces)), tuple(aliases), tuple(uris)
+
+
+CSDL_LOADERS = {
+    'lxml': parse_csdl_lxml,
+    'soup': parse_csdl_soup,
+}
+
+DEFAULT_LOADER = 'lxml'
+
+
+def parse_csdl(data, loader=DEFAULT_LOADER):
+    """
+    Parse CSDL text into a tree of CsdlElement
+
+    :param data: CSDL document as a string
+    :param loader: name of the loader engine, one of CSDL_LOADERS
+    :return: document CsdlElement, whose children are the top level tags
+    """
+    if loader not in CSDL_LOADERS:
+        raise ValueError('Unknown CSDL loader {}, expected one of {}'.format(loader, list(CSDL_LOADERS)))
+    return CSDL_LOADERS[loader](data)
@@ -4,6 +4,7 @@
 
 import re
 import logging
+from functools import cached_property, lru_cache
 from types import SimpleNamespace
 
 my_logger = logging.getLogger()
@@ -27,12 +28,56 @@ def create_entry(name, value, type, exists, result):
     })
 
 
+class TypeName(str):
+    """
+    Type or namespace string, parsed once.
+
+    Carries what getNamespace, getNamespaceUnversioned, getType, getVersion and splitVersionString
+    give for its string, and those return it directly when given a TypeName.
+    Create through getTypeName, so each distinct string is parsed only once.
+    """
+
+    @cached_property
+    def namespace(self):
+        return getTypeName(getNamespace(str(self)))
+
+    @cached_property
+    def namespace_unversioned(self):
+        return getTypeName(getNamespaceUnversioned(str(self)))
+
+    @cached_property
+    def type_name(self):
+        return getType(str(self))
+
+    @cached_property
+    def version(self):
+        return getVersion(str(self))
+
+    @cached_property
+    def version_tuple(self):
+        return splitVersionString(str(self))
+
+
+@lru_cache(maxsize=16384)
+def getTypeName(string: str):
+    """getTypeName
+
+    Gives the interned TypeName of a type or namespace string
+
+    :param string:  A type/namespace string
+    :type string: str
+    """
+    return string if type(string) is TypeName else TypeName(string)
+
+
 def splitVersionString(v_string):
     """
     Split x.y.z and Namespace.vX_Y_Z, vX_Y_Z type version strings into tuples of integers
 
     :return: tuple of integers
     """
+    if type(v_string) is TypeName:
+        return v_string.version_tuple
     if(re.match('([a-zA-Z0-9_.-]*\.)+[a-zA-Z0-9_.-]*', v_string) is not None):
         new_string = getVersion(v_string)
         if new_string is not None:
@@ -78,6 +123,8 @@ def getNamespace(string: str):
     :param string:  A type string
     :type string: str
     """
+    if type(string) is TypeName:
+        return string.namespace
     if '#' in string:
         string = string.rsplit('#', 1)[1]
     return string.rsplit('.', 1)[0]
@@ -91,6 +138,8 @@ def getVersion(string: str):
     :param string:  A type/namespace string
     :type string: str
     """
+    if type(string) is TypeName:
+        return string.version
     regcap = re.search(versionpattern, string)
     return regcap.group() if regcap else None
 
@@ -103,6 +152,8 @@ def getNamespaceUnversioned(string: str):
     :param string:
     :type string: str
     """
+    if type(string) is TypeName:
+        return string.namespace_unversioned
     if '#' in string:
         string = string.rsplit('#', 1)[1]
     return string.split('.', 1)[0]
@@ -116,6 +167,8 @@ def getType(string: str):
     :param string:
     :type string: str
     """
+    if type(string) is TypeName:
+        return string.type_name
     if '#' in string:
         string = string.rsplit('#', 1)[1]
     return string.rsplit('.', 1)[-1]
@@ -0,0 +1,133 @@
+# Copyright Notice:
+# Copyright 2026 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Validator/blob/master/LICENSE.md
+
+import gc
+import logging
+import multiprocessing
+import os
+from collections import namedtuple
+
+from redfish_service_validator.catalog import MissingSchemaError, SchemaCatalog
+
+my_logger = logging.getLogger(__name__)
+
+SMAPS_FIELDS = ['Rss', 'Pss', 'Shared_Clean', 'Shared_Dirty', 'Private_Clean', 'Private_Dirty']
+
+memoryReportTuple = namedtuple("memoryReportTuple", ["pid", "rss", "pss", "shared", "private"])
+targetResultTuple = namedtuple("targetResultTuple", ["target", "result", "memory"])
+
+# work function and catalog inherited by forked workers, set only while run_targets runs
+_shared_work = None
+
+
+def get_memory_report(pid='self'):
+    """
+    Get the shared and private memory of a process, from /proc/<pid>/smaps_rollup
+
+    :param pid: process id, or 'self'
+    :return: memoryReportTuple in kB, or None where smaps are not available
+    """
+    values = {}
+    try:
+        with open('/proc/{}/smaps_rollup'.format(pid)) as f:
+            for line in f:
+                key, _, rest = line.partition(':')
+                if key in SMAPS_FIELDS:
+                    values[key] = int(rest.split()[0])
+    except (OSError, ValueError):
+        return None
+    if len(values) != len(SMAPS_FIELDS):
+        return None
+    return memoryReportTuple(os.getpid() if pid == 'self' else pid, values['Rss'], values['Pss'],
+                             values['Shared_Clean'] + values['Shared_Dirty'], values['Private_Clean'] + values['Private_Dirty'])
+
+
+def prepare_shared_catalog(my_catalog):
+    """
+    Build every document and the derived values of every type of a catalog, so forked workers find them ready
+
+    Anything a worker builds itself lands in its private memory
+
+    :param my_catalog: SchemaCatalog
+    :return: the same SchemaCatalog
+    """
+    for name in my_catalog.schema_files:
+        my_catalog.getSchemaDoc(name)
+    my_catalog.getUriIndex()
+    for doc in my_catalog.catalog.values():
+        for my_class in doc.classes.values():
+            for my_type in my_class.my_types.values():
+                try:
+                    my_type.getAncestry()
+                    if my_type.tag_type in ['EntityType', 'ComplexType']:
+                        my_type.getProperties()
+                except MissingSchemaError:
+                    my_logger.debug('Schema missing while preparing {}'.format(my_type))
+    return my_catalog
+
+
+def _run_target(target):
+    work, my_catalog = _shared_work
+    result = work(target, my_catalog)
+    return targetResultTuple(target, result, get_memory_report())
+
+
+def run_targets(targets, work, my_catalog, workers=4):
+    """
+    Run work(target, catalog) for each target, each in a worker forked from this process
+
+    The catalog is prepared once here, then frozen with gc.freeze so the collector doesn't write to its
+    pages, and workers share it copy-on-write instead of each building their own.
+    Without fork, targets are run one after another in this process.
+
+    :param targets: list of targets, such as argument lists for RedfishServiceValidator.main
+    :param work: function(target, catalog), its result must be picklable
+    :param my_catalog: SchemaCatalog to share
+    :param workers: number of worker processes
+    :return: list of targetResultTuple, in order of targets; memory is the worker's memoryReportTuple, or None
+    """
+    global _shared_work
+    prepare_shared_catalog(my_catalog)
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        my_logger.warning('Forked workers are not available, running {} targets in this process'.format(len(targets)))
+        return [targetResultTuple(x, work(x, my_catalog), None) for x in targets]
+
+    _shared_work = (work, my_catalog)
+    gc.collect()
+    gc.freeze()
+    try:
+        # a fresh worker per target, each one starting from the shared catalog
+        with multiprocessing.get_context('fork').Pool(processes=workers, maxtasksperchild=1) as pool:
+            results = pool.map(_run_target, targets, chunksize=1)
+    finally:
+        gc.unfreeze()
+        _shared_work = None
+
+    parent = get_memory_report()
+    if parent is not None:
+        my_logger.info('Parent process {}: {} kB resident, {} kB shared, {} kB private'.format(parent.pid, parent.rss, parent.shared, parent.private))
+    for item in results:
+        if item.memory is not None:
+            my_logger.info('Worker {}: {} kB resident, {} kB shared, {} kB private, {} kB proportional'.format(
+                item.memory.pid, item.memory.rss, item.memory.shared, item.memory.private, item.memory.pss))
+    return results
+
+
+def _validate_target(argslist, my_catalog):
+    from redfish_service_validator.RedfishServiceValidator import main
+    return main(argslist, shared_catalog=my_catalog)
+
+
+def validate_targets(argslists, schema_directory, workers=4, compact=False):
+    """
+    Run the validator against several services, sharing one catalog of the schema directory between workers
+
+    :param argslists: list of argument lists, one per service, as given to RedfishServiceValidator.main
+    :param schema_directory: directory of local schema files, holding every schema the services use
+    :param workers: number of worker processes
+    :param compact: release the schema trees once loaded, see SchemaCatalog
+    :return: list of targetResultTuple, whose result is what main returns
+    """
+    my_catalog = SchemaCatalog(schema_directory, compact=compact)
+    return run_targets(argslists, _validate_target, my_catalog, workers)
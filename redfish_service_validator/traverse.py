@@ -32,7 +32,7 @@ def getLogger():
     return my_logger
 
 class rfService():
-    def __init__(self, config):
+    def __init__(self, config, shared_catalog=None):
         traverseLogger.info('Setting up service...')
         self.active, self.config = False, config
         self.logger = getLogger()
@@ -71,8 +71,15 @@ class rfService():
         else:
             self.metadata = Metadata(None, self, my_logger)
 
-        # Build the data model based on cached schema files
-        self.catalog = catalog.SchemaCatalog(self.config['metadatafilepath'])
+        # Build the data model based on cached schema files, unless one is shared with us
+        if shared_catalog is not None:
+            # the $metadata step may have downloaded schemas the shared catalog hasn't seen
+            self.catalog = shared_catalog
+            self.catalog.indexNewSchemaFiles()
+        else:
+            # values from a config file are strings
+            compact = str(self.config.get('compactcatalog', False)).lower() == 'true'
+            self.catalog = catalog.SchemaCatalog(self.config['metadatafilepath'], compact=compact)
 
         target_version = 'n/a'
 
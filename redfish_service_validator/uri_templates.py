@@ -0,0 +1,106 @@
+# Copyright Notice:
+# Copyright 2026 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Validator/blob/master/LICENSE.md
+
+import re
+from collections import namedtuple
+
+URI_ID_REGEX = '\{[A-Za-z0-9]*Id\}'
+
+VALID_ID_REGEX = '([A-Za-z0-9.!#$&-;=?\[\]_~])+'
+
+UriMatch = namedtuple("UriMatch", ["Template", "Index", "EndsWithId"])
+
+
+class UriTemplateMatcher:
+    """
+    Compiled matcher for the Redfish.Uris templates of a type.
+
+    All templates are compiled into one alternation, tried in their given order,
+    so a match tells which template an @odata.id belongs to.
+    """
+
+    def __init__(self, templates):
+        self.templates = tuple(templates)
+        # whether the last segment of each template is an Id, to compare against the Id property
+        self.ends_with_id = tuple(re.match(URI_ID_REGEX, x.rsplit('/')[-1]) is not None for x in self.templates)
+        self.regex = re.compile("|".join(
+            "(?P<uri{}>{})".format(cnt, re.sub(URI_ID_REGEX, VALID_ID_REGEX, x)) for cnt, x in enumerate(self.templates)))
+
+    def match(self, uri):
+        """
+        Match a URI against the templates
+
+        :param uri: @odata.id value
+        :return: UriMatch of the first matching template, or None
+        """
+        if not self.templates:
+            return None
+        match = self.regex.fullmatch(uri)
+        if match is None:
+            return None
+        index = int(match.lastgroup[3:])
+        return UriMatch(self.templates[index], index, self.ends_with_id[index])
+
+
+class UriTemplateIndex:
+    """
+    Trie over the URI templates of every type in a catalog.
+
+    Maps a URI to the types whose templates it fits, in one pass over its segments;
+    template parameters such as {ChassisId} match any single segment.
+    """
+
+    WILDCARD = None
+    TYPES = ('types',)
+
+    def __init__(self):
+        self.root = {}
+        self.count = 0
+
+    @staticmethod
+    def _segments(uri):
+        if uri != '/redfish/v1/' and uri.endswith('/'):
+            uri = uri.rstrip('/')
+        return uri.split('/')
+
+    def add(self, template, fulltype):
+        """
+        Add a template of a type to the trie
+
+        :param template: Redfish.Uris template
+        :param fulltype: type string of the type defining the template
+        """
+        node = self.root
+        for segment in self._segments(template):
+            key = UriTemplateIndex.WILDCARD if re.fullmatch(r'\{[^{}/]*\}', segment) else segment
+            node = node.setdefault(key, {})
+        types = node.setdefault(UriTemplateIndex.TYPES, [])
+        if fulltype not in types:
+            types.append(fulltype)
+        self.count += 1
+
+    def getCandidateTypes(self, uri):
+        """
+        Get the types whose templates match a URI
+
+        :param uri: @odata.id value
+        :return: list of type strings, in the order they were added
+        """
+        nodes = [self.root]
+        for segment in self._segments(uri):
+            next_nodes = []
+            for node in nodes:
+                if segment in node:
+                    next_nodes.append(node[segment])
+                if segment and UriTemplateIndex.WILDCARD in node:
+                    next_nodes.append(node[UriTemplateIndex.WILDCARD])
+            nodes = next_nodes
+            if not nodes:
+                return []
+        candidates = []
+        for node in nodes:
+            for fulltype in node.get(UriTemplateIndex.TYPES, []):
+                if fulltype not in candidates:
+                    candidates.append(fulltype)
+        return candidates
@@ -1,8 +1,8 @@
 
 from collections import Counter, OrderedDict
-from redfish_service_validator.catalog import REDFISH_ABSENT, MissingSchemaError, ExcerptTypes, get_fuzzy_property
+from redfish_service_validator.catalog import REDFISH_ABSENT, MissingSchemaError, ExcerptTypes, RedfishType, get_fuzzy_property
 
-from redfish_service_validator.helper import getNamespace, getNamespaceUnversioned, getType, checkPayloadConformance
+from redfish_service_validator.helper import getNamespace, getNamespaceUnversioned, getType, getTypeName, checkPayloadConformance
 
 import logging
 
@@ -15,23 +15,29 @@ def validateExcerpt(prop, val):
 
     if base == 'entity':
         my_excerpt_type, my_excerpt_tags = prop.Type.excerptType, prop.Type.excerptTags
-        my_props = prop.Type.createObject().populate(val).properties
+        # only members present in the value are checked
+        if val is None or val == REDFISH_ABSENT:
+            my_members = []
+        elif prop.Type.IsNav and isinstance(val, dict):
+            my_members = prop.Type.getExcerptMembers(val)
+        else:
+            # may be cast or reported when populated, so type its members that way
+            my_props = prop.Type.createObject().populate(val).properties
+            my_members = [(name, x.Type.excerptType, x.Type.excerptTags) for name, x in my_props.items() if x.HasSchema and x.Exists]
 
-        for name, innerprop in my_props.items():
-            if not innerprop.HasSchema:
-                continue
-            valid_tagging = any([x in my_excerpt_tags for x in innerprop.Type.excerptTags]) or innerprop.Type.excerptTags == []
+        for name, inner_type, inner_tags in my_members:
+            valid_tagging = any([x in my_excerpt_tags for x in inner_tags]) or inner_tags == []
             if my_excerpt_type == ExcerptTypes.NEUTRAL:
-                if innerprop.Type.excerptType == [ExcerptTypes.EXCLUSIVE] and innerprop.Exists:
-                    my_logger.error('{}: Exclusive Excerpt {} should not exist in this Resource/ComplexType'.format(prop.Name, innerprop.Name))
+                if inner_type == [ExcerptTypes.EXCLUSIVE]:
+                    my_logger.error('{}: Exclusive Excerpt {} should not exist in this Resource/ComplexType'.format(prop.Name, name))
                     return False
             if my_excerpt_type == ExcerptTypes.CONTAINS:
-                if innerprop.Type.excerptType in [ExcerptTypes.ALLOWED, ExcerptTypes.EXCLUSIVE, ExcerptTypes.CONTAINS]:
-                    if innerprop.Exists and not valid_tagging:
-                        my_logger.error('{}: Excerpt tags of owner {} do not match property {} {}'.format(innerprop.Name, prop.Name, my_excerpt_tags, innerprop.Type.excerptTags))
+                if inner_type in [ExcerptTypes.ALLOWED, ExcerptTypes.EXCLUSIVE, ExcerptTypes.CONTAINS]:
+                    if not valid_tagging:
+                        my_logger.error('{}: Excerpt tags of owner {} do not match property {} {}'.format(name, prop.Name, my_excerpt_tags, inner_tags))
                         return False
-                elif innerprop.Exists:
-                    my_logger.error('{}: Property is not a valid Excerpt'.format(innerprop.Name))
+                else:
+                    my_logger.error('{}: Property is not a valid Excerpt'.format(name))
                     return False
 
     # check our prop if it's EXCLUSIVE
@@ -44,7 +50,8 @@ def validateExcerpt(prop, val):
 
 def validateAction(act_fulltype, actionDecoded, all_actions):
     actionMessages, actionCounts = OrderedDict(), Counter()
-    act_namespace, act_type = getNamespace(act_fulltype.strip('#')), getType(act_fulltype)
+    act_fulltype = getTypeName(act_fulltype)
+    act_namespace, act_type = getNamespace(act_fulltype), getType(act_fulltype)
     actPass = False
     if act_type not in all_actions:
         my_logger.error('Action {} does not exist in Namespace {}'.format(act_type, act_namespace))
@@ -128,10 +135,10 @@ def validateEntity(service, prop, val, parentURI=""):
     if success and my_type in generics:
         return True
     elif success:
-        my_target_type = data.get('@odata.type', 'Resource.Item').strip('#')
+        my_target_type = getTypeName(data.get('@odata.type', 'Resource.Item').strip('#'))
         # Attempt to grab an appropriate type to test against and its schema
         # Default lineup: payload type, collection type, property type
-        my_type_chain = [str(x) for x in prop.Type.getTypeTree()]
+        my_type_chain = prop.Type.getAncestry()
 
         try:
             my_target_schema = prop.Type.catalog.getSchemaDocByClass(getNamespaceUnversioned(my_target_type))
@@ -143,8 +150,7 @@ def validateEntity(service, prop, val, parentURI=""):
             my_logger.error('{}: Linked resource reports version {} not in Schema'.format(name.split(':')[-1], my_target_type))
         else:
             my_target_type = my_target_schema.getTypeInSchemaDoc(my_target_type)
-            all_target_types = [str(x) for x in my_target_type.getTypeTree()]
-            if any(x in my_type_chain for x in all_target_types):
+            if my_type_chain & my_target_type.getAncestry():
                 return True
             else:
                 my_logger.error('{}: Linked resource reports version {} not in Typechain' .format(name.split(':')[-1], my_target_type))
@@ -213,7 +219,7 @@ def validateComplex(service, sub_obj, prop_name, oem_check=True):
                 subCounts['unverifiedAdditional.complex'] += 1
                 subMsgs[key] = (displayValue(item), '-', '-', 'Additional')
             
-            fuzz = get_fuzzy_property(key, sub_obj.properties)
+            fuzz = get_fuzzy_property(key, sub_obj.properties, index=sub_obj.Type.getFuzzyIndex())
             if fuzz != key and fuzz in sub_obj.properties:
                 subMsgs[fuzz] = ('-', '-', '-', 'INVALID')
                 my_logger.error('Attempting {} (from {})?'.format(fuzz, key))
@@ -249,8 +255,10 @@ def validateComplex(service, sub_obj, prop_name, oem_check=True):
         #         my_actions.append((new_act_name, REDFISH_ABSENT))
 
         for act_name, actionDecoded in my_actions:
-            act_schema = sub_obj.Type.catalog.getSchemaDocByClass(getNamespace(act_name))
-            act_class = act_schema.classes.get(getNamespace(act_name))
+            act_name = getTypeName(act_name)
+            act_class, error = sub_obj.Type.catalog.resolve('action', act_name)
+            if error is not None:
+                raise error
 
             a, c = validateAction(act_name, actionDecoded, act_class.actions)
 
@@ -269,6 +277,15 @@ def displayType(propTypeObject, is_collection=False):
     :param is_collection: For collections: True if these types are for the collection; False if for a member
     :return: the simplified type to display
     """
+    if isinstance(propTypeObject, RedfishType):
+        display_types = propTypeObject.getValidationPlan().DisplayTypes
+        if is_collection not in display_types:
+            display_types[is_collection] = _displayType(propTypeObject, is_collection)
+        return display_types[is_collection]
+    return _displayType(propTypeObject, is_collection)
+
+
+def _displayType(propTypeObject, is_collection=False):
     propRealType, propCollection = propTypeObject.getBaseType()
     propType = propTypeObject.fulltype
     # Edm.* and other explicit types
@@ -410,16 +427,14 @@ def checkPropertyConformance(service, prop_name, prop, parent_name=None, parent_
         counts['warnDeprecated'] += 1
         my_logger.warning('{}: The given property is deprecated: {}'.format(prop_name, prop.Type.Deprecated.get('String', '')))
 
-    if prop.Type.Revisions is not None:
-        for tag_item in prop.Type.Revisions:
-            revision_tag = tag_item.find('PropertyValue', attrs={ 'EnumMember': 'Redfish.RevisionKind/Deprecated', 'Property': 'Kind'})
-            if revision_tag and not prop.Type.IsMandatory:
-                desc_tag = tag_item.find('PropertyValue', attrs={'Property': 'Description'})
-                version_tag = tag_item.find('PropertyValue', attrs={'Property': 'Version'})
-                deprecatedPassOrSinceVersion = version_tag.attrs.get('String', False) if version_tag else False
+    my_plan = prop.Type.getValidationPlan()
+    if my_plan.Revisions is not None:
+        for is_deprecated, description, version in my_plan.Revisions:
+            if is_deprecated and not my_plan.IsMandatory:
+                deprecatedPassOrSinceVersion = version
                 counts['warnDeprecated'] += 1
-                if desc_tag:
-                    my_logger.warning('{}: The given property is deprecated: {}'.format(prop_name, desc_tag.attrs.get('String', '')))
+                if description is not None:
+                    my_logger.warning('{}: The given property is deprecated: {}'.format(prop_name, description))
                 else:
                     my_logger.warning('{}: The given property is deprecated'.format(prop_name))
 
@@ -103,7 +103,7 @@ def validateSingleURI(service, URI, uriName='', expectedType=None, expectedJson=
                 my_type = my_type.fulltype
             redfish_schema = service.catalog.getSchemaDocByClass(my_type)
             redfish_type = redfish_schema.getTypeInSchemaDoc(my_type)
-            redfish_obj = catalog.RedfishObject(redfish_type, 'Object', parent=parent).populate(me['payload']) if redfish_type else None
+            redfish_obj = catalog.RedfishObject.getPrototype(redfish_type, 'Object', parent=parent).populate(me['payload']) if redfish_type else None
 
         if redfish_obj:
             me['fulltype'] = redfish_obj.Type.fulltype
@@ -126,7 +126,7 @@ def validateSingleURI(service, URI, uriName='', expectedType=None, expectedJson=
     odata_id = me['payload'].get('@odata.id')
     if odata_id is None:
         # Do not error for namespace.type MessageRegistry.MessageRegistry, etc 
-        if any(['{}.{}'.format(x, x) in redfish_obj.Type.getTypeTree() for x in ['MessageRegistry', 'AttributeRegistry', 'PrivilegeRegistry']]):
+        if redfish_obj.Type.isA(*['{}.{}'.format(x, x) for x in ['MessageRegistry', 'AttributeRegistry', 'PrivilegeRegistry']]):
             my_logger.debug('No @odata.id was found in this resource, but not needed')
         else:
             my_logger.error('No @odata.id was found in this resource')
@@ -173,6 +173,9 @@ def validateSingleURI(service, URI, uriName='', expectedType=None, expectedJson=
                     counts['failRedfishUri'] += 1
                     messages['@odata.id'].result = 'FAIL'
                     my_logger.error('URI {} does not match the following required URIs in Schema of {}'.format(odata_id, redfish_obj.Type))
+                    candidate_types = redfish_obj.Type.catalog.getUriIndex().getCandidateTypes(odata_id)
+                    if len(candidate_types):
+                        my_logger.info('URI {} matches the URIs in Schema of {}'.format(odata_id, ', '.join(candidate_types)))
 
 
 
@@ -217,7 +220,7 @@ def validateSingleURI(service, URI, uriName='', expectedType=None, expectedJson=
 
             propMessages = {x:create_entry(x, *y) if isinstance(y, tuple) else y for x,y in propMessages.items()}
 
-            if 'MessageRegistry.MessageRegistry' not in redfish_obj.Type.getTypeTree():
+            if not redfish_obj.Type.isA('MessageRegistry.MessageRegistry'):
                 if '@Redfish.Copyright' in propMessages:
                     modified_entry = propMessages['@Redfish.Copyright']
                     modified_entry.result = 'FAIL'
@@ -257,7 +260,7 @@ def validateSingleURI(service, URI, uriName='', expectedType=None, expectedJson=
             counts['unverifiedAdditional'] += 1
             messages[key] = create_entry(key, displayValue(item), '-', '-', 'Additional')
 
-        fuzz = catalog.get_fuzzy_property(key, redfish_obj.properties)
+        fuzz = catalog.get_fuzzy_property(key, redfish_obj.properties, index=redfish_obj.Type.getFuzzyIndex())
         if fuzz != key and fuzz in redfish_obj.properties:
             messages[fuzz] = create_entry(fuzz, '-', '-', '-', 'INVALID')
             my_logger.error('Attempting {} (from {})?'.format(fuzz, key))
@@ -283,11 +286,11 @@ def validateSingleURI(service, URI, uriName='', expectedType=None, expectedJson=
 
     my_logger.verbose1('%s, %s', SchemaFullType, counts)
 
-    # Get all links available
+    # Get all links available, collected while populating
+    links = redfish_obj.getLinks()
+    my_logger.debug(links)
 
-    my_logger.debug(redfish_obj.getLinks())
-
-    return True, counts, results, redfish_obj.getLinks(), redfish_obj
+    return True, counts, results, links, redfish_obj
 
 
 def validateURITree(service, URI, uriName, expectedType=None, expectedJson=None, parent=None, allLinks=None, inAnnotation=False):
@@ -309,7 +312,7 @@ def validateURITree(service, URI, uriName, expectedType=None, expectedJson=None,
         service.catalog.flags['ignore_uri_checks'] = False
 
     # If successful and a MessageRegistryFile...
-    if validateSuccess and 'MessageRegistryFile.MessageRegistryFile' in thisobj.Type.getTypeTree():
+    if validateSuccess and thisobj.Type.isA('MessageRegistryFile.MessageRegistryFile'):
         # thisobj['Location'].Collection[0]['Uri'].Exists
         if 'Location' in thisobj:
             for sub_obj in thisobj['Location'].Collection:
@@ -0,0 +1,99 @@
+# Copyright Notice:
+# Copyright 2026 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Validator/blob/master/LICENSE.md
+#
+# Measurements of the catalog, kept out of the unit tests as they depend on the platform and Python version
+#
+# Usage: python tests/benchmark_catalog.py [name ...]
+#
+
+import gc
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append('./')
+sys.path.append('./tests/')
+
+import redfish_service_validator.catalog as catalog
+from test_catalog import DEEP_RESOURCE_SCHEMA
+
+logging.Logger.verbose1 = logging.Logger.debug
+logging.Logger.verbose2 = logging.Logger.debug
+
+SCHEMA_DIR = './tests/testdata/schemas/'
+
+
+def count_nodes(node):
+    return 1 + sum(count_nodes(x) for x in getattr(node, 'properties', {}).values())
+
+
+def bench_object_memory():
+    """Bytes per populated property node"""
+    my_catalog = catalog.SchemaCatalog(SCHEMA_DIR, use_snapshot=False)
+    my_type = my_catalog.getTypeInCatalog('Example.v1_7_0.Example')
+    with open('./tests/testdata/payloads/simple.json') as f:
+        payload = json.load(f)
+    my_prototype = catalog.RedfishObject.getPrototype(my_type)
+    my_prototype.populate(payload, check=True)
+
+    tracemalloc.start()
+    my_objects = [my_prototype.populate(payload, check=True) for _ in range(100)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print('bytes per populated property: {:.0f}'.format(size / sum(count_nodes(x) for x in my_objects)))
+
+
+def bench_compact_catalog():
+    """Bytes held by a catalog built eagerly, with and without compact mode"""
+    sizes = {}
+    for compact in [False, True]:
+        gc.collect()
+        tracemalloc.start()
+        my_catalog = catalog.SchemaCatalog(SCHEMA_DIR, use_snapshot=False, lazy=False, compact=compact)
+        gc.collect()
+        sizes[compact], _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del my_catalog
+    print('catalog bytes: {} full, {} compact ({:.0%} less)'.format(sizes[False], sizes[True], 1 - sizes[True] / sizes[False]))
+
+
+def bench_iterative_populate():
+    """Seconds to populate OEM objects nested through additional properties, by engine and depth"""
+    with tempfile.TemporaryDirectory() as schema_dir:
+        with open(os.path.join(schema_dir, 'Resource_v1.xml'), 'w') as f:
+            f.write(DEEP_RESOURCE_SCHEMA)
+        my_catalog = catalog.SchemaCatalog(schema_dir, use_snapshot=False)
+        my_type = my_catalog.getTypeInCatalog('Resource.v1_0_0.Resource')
+        for depth in [10, 100, 1000]:
+            payload = {'Id': '1', 'Oem': {}}
+            node = payload['Oem']
+            for _ in range(depth):
+                node['Level'] = {}
+                node = node['Level']
+            for iterative in [False, True]:
+                my_catalog.flags['iterative_populate'] = iterative
+                start = time.perf_counter()
+                try:
+                    catalog.RedfishObject(my_type).populate(payload)
+                    result = ''
+                except RecursionError:
+                    result = ', recursion limit reached'
+                print('depth {} {}: {:.4f}s{}'.format(depth, 'iterative' if iterative else 'recursive', time.perf_counter() - start, result))
+
+
+BENCHMARKS = {
+    'object_memory': bench_object_memory,
+    'compact_catalog': bench_compact_catalog,
+    'iterative_populate': bench_iterative_populate,
+}
+
+
+if __name__ == '__main__':
+    for name in sys.argv[1:] or list(BENCHMARKS):
+        print('{}: {}'.format(name, BENCHMARKS[name].__doc__))
+        BENCHMARKS[name]()
@@ -8,17 +8,88 @@
 import unittest
 import sys
 import pprint
+import os
+import shutil
+import tempfile
+import json
+import gc
+import multiprocessing
+import traceback
+from unittest import mock
 
 sys.path.append('../')
 
 import redfish_service_validator.catalog as catalog
+import redfish_service_validator.catalog_cache as catalog_cache
+import redfish_service_validator.codegen as codegen
+import redfish_service_validator.helper as helper
+import redfish_service_validator.shared_catalog as shared_catalog
+import redfish_service_validator.validateRedfish as validateRedfish
 
 import logging
 
 logging.Logger.verbose1 =  logging.Logger.debug
 logging.Logger.verbose2 =  logging.Logger.debug
 
+def dump_element(element):
+    return (element.name, element.attrs, element.text, [dump_element(x) for x in element.children])
+
+
+def dump_type(my_type, skip_tags=()):
+    tags = {x: [dump_element(r) for r in y] if isinstance(y, list) else y for x, y in my_type.tags.items() if x not in skip_tags}
+    return (my_type.fulltype, my_type.tag_type, tags, my_type.IsNullable, my_type.IsMandatory, my_type.excerptType,
+            my_type.excerptTags, {x: dump_type(y, skip_tags) for x, y in my_type.unique_properties.items()})
+
+
+def dump_catalog(my_catalog, skip_tags=()):
+    """Plain representation of everything a catalog holds, for comparing catalogs"""
+    docs = {}
+    for name, doc in my_catalog.catalog.items():
+        classes = {}
+        for ns, my_class in doc.classes.items():
+            classes[ns] = {
+                'types': {x: dump_type(y, skip_tags) for x, y in my_class.my_types.items()},
+                'terms': {x: dump_type(y, skip_tags) for x, y in my_class.terms.items()},
+                'actions': {x: dump_element(y) for x, y in my_class.actions.items()},
+            }
+        docs[name] = (doc.refs, doc.alias, classes, dump_element(doc.soup))
+    return docs, my_catalog.alias, {x: list(y) for x, y in my_catalog.catalog_by_class.items()}
+
+
+DEEP_RESOURCE_SCHEMA = """<?xml version="1.0" encoding="UTF-8"?>
+<edmx:Edmx xmlns:edmx="http://docs.oasis-open.org/odata/ns/edmx" Version="4.0">
+  <edmx:DataServices>
+    <Schema xmlns="http://docs.oasis-open.org/odata/ns/edm" Namespace="Resource">
+      <ComplexType Name="Oem">
+        <Annotation Term="OData.AdditionalProperties" Bool="true"/>
+      </ComplexType>
+      <ComplexType Name="OemObject">
+        <Annotation Term="OData.AdditionalProperties" Bool="true"/>
+      </ComplexType>
+      <EntityType Name="Resource" Abstract="true"/>
+    </Schema>
+    <Schema xmlns="http://docs.oasis-open.org/odata/ns/edm" Namespace="Resource.v1_0_0">
+      <EntityType Name="Resource" BaseType="Resource.Resource">
+        <Property Name="Id" Type="Edm.String" Nullable="false"/>
+        <Property Name="Oem" Type="Resource.Oem" Nullable="false"/>
+      </EntityType>
+    </Schema>
+  </edmx:DataServices>
+</edmx:Edmx>
+"""
+
+
 class TestCatalog(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # keep compiled snapshots out of the test data
+        cls.snapshot_tmp = tempfile.TemporaryDirectory()
+        cls.snapshot_dir = cls.snapshot_tmp.name
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.snapshot_tmp.cleanup()
+
     def test_fuzzy(self):
         print('\n')
         val = catalog.get_fuzzy_property('PropertyA', {'Name': 'Payload', 'PropertyB': False})
@@ -31,9 +102,34 @@ class TestCatalog(unittest.TestCase):
         self.assertEqual(val, 'PropertyA')
         # OK
 
+    def test_fuzzy_index(self):
+        print('\n')
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', snapshot_dir=self.snapshot_dir)
+        my_type = my_catalog.getTypeInCatalog('Example.v1_7_0.Example')
+        my_index = my_type.getFuzzyIndex()
+        self.assertIs(my_type.getFuzzyIndex(), my_index)
+        names = list(my_type.getProperties())
+        # the same answers as difflib, for typos, other cases, ties and names outside the index
+        words = [x.lower() for x in names] + [x[:-1] for x in names] + [x + 's' for x in names] + [x[1:] for x in names]
+        words += ['', 'a', 'Id', 'Nmae', 'Oem', 'Odata', 'PropertyA', 'Statu', 'Links', 'Actoins', 'Descriptio']
+        candidates = [names, names + ['Extra', 'Nam', 'PropertyB', 'Stats'], [x for x in names if x != 'Oem'], ['Extra']]
+        for my_names in candidates:
+            for word in words:
+                self.assertEqual(my_index.getCloseMatches(word, my_names), catalog.difflib.get_close_matches(word, my_names, 1, 0.70), (word, my_names))
+                self.assertEqual(catalog.get_fuzzy_property(word, dict.fromkeys(my_names, True), index=my_index),
+                                 catalog.get_fuzzy_property(word, dict.fromkeys(my_names, True)))
+        self.assertIn('Nmae', my_index.matches)
+
+        # bounded, dropping the least recently used
+        my_index = catalog.FuzzyPropertyIndex(names, maxsize=4)
+        for word in ['Nmae', 'Statu', 'Links', 'Nmae', 'Actoins', 'Descriptio']:
+            my_index.getMatches(word)
+        self.assertEqual(list(my_index.matches), ['Links', 'Nmae', 'Actoins', 'Descriptio'])
+        self.assertEqual(my_index.getCloseMatches('Statu', names), catalog.difflib.get_close_matches('Statu', names, 1, 0.70))
+
     def test_catalog(self):
         print('\n')
-        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/')
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', snapshot_dir=self.snapshot_dir)
 
         my_schema_doc = my_catalog.getSchemaDocByClass('Example')
 
@@ -46,9 +142,187 @@ class TestCatalog(unittest.TestCase):
         my_type = my_catalog.getTypeInCatalog('Example.v1_2_0.Links')
         # OK
     
+    def test_catalog_snapshot(self):
+        print('\n')
+        with tempfile.TemporaryDirectory() as schema_dir:
+            for name in os.listdir('./tests/testdata/schemas/'):
+                if name.endswith('.xml'):
+                    shutil.copy(os.path.join('./tests/testdata/schemas/', name), schema_dir)
+            cache_dir = os.path.join(schema_dir, catalog.CACHE_DIRNAME)
+
+            with mock.patch.object(catalog, 'parse_csdl', wraps=catalog.parse_csdl) as parser:
+                catalog.SchemaCatalog(schema_dir, lazy=False)
+                self.assertEqual(parser.call_count, 2)
+            self.assertEqual(len(os.listdir(cache_dir)), 3)
+
+            # unchanged pack is loaded entirely from the snapshot
+            with mock.patch.object(catalog, 'parse_csdl', wraps=catalog.parse_csdl) as parser:
+                my_catalog = catalog.SchemaCatalog(schema_dir, lazy=False)
+                self.assertEqual(parser.call_count, 0)
+            my_type = my_catalog.getTypeInCatalog('Example.v1_7_0.Example')
+            self.assertEqual(len(my_type.getUris()), 3)
+
+            # only the changed document is parsed again, and its old entry is dropped
+            with open(os.path.join(schema_dir, 'Example_v1.xml'), 'a') as f:
+                f.write('<!-- changed -->\n')
+            with mock.patch.object(catalog, 'parse_csdl', wraps=catalog.parse_csdl) as parser:
+                catalog.SchemaCatalog(schema_dir, lazy=False)
+                self.assertEqual(parser.call_count, 1)
+            self.assertEqual(len(os.listdir(cache_dir)), 3)
+
+        # snapshot kept in its own directory, an unwritable one is only reported at debug level
+        with tempfile.TemporaryDirectory() as snapshot_dir:
+            catalog.SchemaCatalog('./tests/testdata/schemas/', lazy=False, snapshot_dir=snapshot_dir)
+            self.assertEqual(len(os.listdir(snapshot_dir)), 3)
+            self.assertFalse(os.path.exists(os.path.join('./tests/testdata/schemas/', catalog.CACHE_DIRNAME)))
+            with open(os.path.join(snapshot_dir, 'blocked'), 'w') as f:
+                f.write('not a directory')
+            with mock.patch.object(catalog_cache.my_logger, 'warning') as warning:
+                my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', lazy=False, snapshot_dir=os.path.join(snapshot_dir, 'blocked'))
+                self.assertEqual(warning.call_count, 0)
+            self.assertFalse(my_catalog.snapshot.enabled)
+
+    def test_lazy_catalog(self):
+        print('\n')
+        with mock.patch.object(catalog, 'parse_csdl', wraps=catalog.parse_csdl) as parser:
+            my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', use_snapshot=False)
+            self.assertEqual(parser.call_count, 0)
+            self.assertEqual(my_catalog.catalog, {})
+
+            # only the document holding the requested class is built, once
+            my_catalog.getTypeInCatalog('ExampleResource.v1_0_0.ReferenceableMember')
+            my_catalog.getSchemaDocByClass('ExampleResource.v1_1_0')
+            self.assertEqual(parser.call_count, 1)
+            self.assertEqual(list(my_catalog.catalog), ['ExampleResource_v1.xml'])
+
+        eager_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', use_snapshot=False, lazy=False)
+        for name in eager_catalog.catalog:
+            my_catalog.getSchemaDoc(name)
+        self.assertEqual(dump_catalog(my_catalog), dump_catalog(eager_catalog))
+        self.assertRaises(catalog.MissingSchemaError, my_catalog.getSchemaDoc, 'NotExample_v1.xml')
+
+    def test_loader_parity(self):
+        print('\n')
+        soup_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', use_snapshot=False, loader='soup', lazy=False)
+        lxml_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', use_snapshot=False, loader='lxml', lazy=False)
+        self.assertEqual(dump_catalog(soup_catalog), dump_catalog(lxml_catalog))
+        self.assertRaises(ValueError, catalog.SchemaCatalog, './tests/testdata/schemas/', use_snapshot=False, loader='none')
+
+    def test_loader_snapshot(self):
+        print('\n')
+        # each loader keeps its own snapshot entries, so switching loaders really runs the other parser
+        with tempfile.TemporaryDirectory() as snapshot_dir:
+            for loader, parsed, entries in [('lxml', 2, 3), ('soup', 2, 5), ('lxml', 0, 5), ('soup', 0, 5)]:
+                parsers = {x: mock.Mock(wraps=y) for x, y in catalog.CSDL_LOADERS.items()}
+                with mock.patch.dict(catalog.CSDL_LOADERS, parsers):
+                    catalog.SchemaCatalog('./tests/testdata/schemas/', loader=loader, lazy=False, snapshot_dir=snapshot_dir)
+                self.assertEqual({x: y.call_count for x, y in parsers.items()}, {x: parsed if x == loader else 0 for x in parsers})
+                self.assertEqual(len(os.listdir(snapshot_dir)), entries)
+
+    def test_compact_catalog(self):
+        print('\n')
+        full_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', use_snapshot=False, lazy=False)
+        compact_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', use_snapshot=False, lazy=False, compact=True)
+
+        for name, doc in compact_catalog.catalog.items():
+            self.assertIsNone(doc._soup)
+            for ns, my_class in doc.classes.items():
+                self.assertIsNone(my_class._class_soup)
+                for type_name, my_type in my_class.my_types.items():
+                    full_type = full_catalog.catalog[name].classes[ns].my_types[type_name]
+                    self.assertIsNone(my_type._type_soup)
+                    for a, b in [(my_type, full_type)] + list(zip(my_type.unique_properties.values(), full_type.unique_properties.values())):
+                        self.assertEqual(vars(a.getValidationPlan()), vars(b.getValidationPlan()))
+                        if a.IsPropertyType and 'Edm.' in a.parent_type[0]:
+                            self.assertEqual(a.getLeafCheck(), b.getLeafCheck())
+                        try:
+                            expected = (b.getUris(), b.getCapabilities(), b.DynamicProperties, b.HasAdditional)
+                        except catalog.MissingSchemaError:
+                            self.assertRaises(catalog.MissingSchemaError, a.getUris)
+                        else:
+                            self.assertEqual((a.getUris(), a.getCapabilities(), a.DynamicProperties, a.HasAdditional), expected)
+                        # released tags are found again on demand
+                        self.assertEqual(dump_element(a.type_soup), dump_element(b.type_soup))
+                        self.assertIsNone(a._type_soup)
+                        for term in catalog.ANNOTATION_TERMS:
+                            if b.getAnnotation(term) is None:
+                                self.assertIsNone(a.getAnnotation(term))
+                            else:
+                                self.assertEqual(a.getAnnotation(term).attrs, b.getAnnotation(term).attrs)
+                        self.assertFalse(set(a.released.annotations) - catalog.ANNOTATION_TERMS)
+                        self.assertFalse(set(a.tags) & set(catalog.DESCRIPTION_TERMS))
+                        self.assertFalse(any(isinstance(x, catalog.CsdlElement) for x in a.released.annotations.values()))
+
+        # the same catalog, trees included, once parsed again, less the descriptions
+        self.assertEqual(dump_catalog(compact_catalog), dump_catalog(full_catalog, catalog.DESCRIPTION_TERMS))
+
+    def test_shared_catalog(self):
+        print('\n')
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', use_snapshot=False)
+
+        def work(target, worker_catalog):
+            # nothing is parsed again in the worker
+            with mock.patch.object(catalog, 'parse_csdl', side_effect=AssertionError):
+                my_type = worker_catalog.getTypeInCatalog(target)
+                return str(my_type), len(my_type.getProperties()), os.getpid()
+
+        targets = ['Example.v1_7_0.Example', 'Example.v1_0_0.Example', 'ExampleResource.v1_0_0.ReferenceableMember']
+        results = shared_catalog.run_targets(targets, work, my_catalog, workers=2)
+        self.assertEqual([x.target for x in results], targets)
+        self.assertEqual([x.result[0] for x in results], targets)
+        self.assertEqual([x.result[1] for x in results], [len(my_catalog.getTypeInCatalog(x).getProperties()) for x in targets])
+        if 'fork' in multiprocessing.get_all_start_methods():
+            self.assertNotIn(os.getpid(), [x.result[2] for x in results])
+            self.assertEqual(gc.get_freeze_count(), 0)
+        report = shared_catalog.get_memory_report()
+        if report is not None:
+            print(report)
+            self.assertGreater(report.rss, 0)
+            for x in results:
+                self.assertEqual(x.memory.pid, x.result[2])
+                self.assertGreater(x.memory.shared, 0)
+
+    def test_shared_catalog_new_schemas(self):
+        print('\n')
+        with tempfile.TemporaryDirectory() as schema_dir:
+            for name in os.listdir('./tests/testdata/schemas/'):
+                if name.endswith('.xml'):
+                    shutil.copy(os.path.join('./tests/testdata/schemas/', name), schema_dir)
+            my_catalog = catalog.SchemaCatalog(schema_dir, use_snapshot=False)
+
+            def work(target, worker_catalog):
+                # as a service's $metadata step would, download a schema only this target uses
+                with open(os.path.join(schema_dir, '.{}.tmp'.format(target)), 'w') as f:
+                    f.write(DEEP_RESOURCE_SCHEMA.replace('Namespace="Resource', 'Namespace="{}'.format(target)).replace('"Resource.', '"{}.'.format(target)))
+                os.replace(os.path.join(schema_dir, '.{}.tmp'.format(target)), os.path.join(schema_dir, '{}_v1.xml'.format(target)))
+                try:
+                    worker_catalog.getTypeInCatalog('{}.v1_0_0.Resource'.format(target))
+                    return 'found before indexing'
+                except catalog.MissingSchemaError:
+                    pass
+                added = worker_catalog.indexNewSchemaFiles()
+                my_type = worker_catalog.getTypeInCatalog('{}.v1_0_0.Resource'.format(target))
+                return str(my_type), '{}_v1.xml'.format(target) in added
+
+            targets = ['OnlyA', 'OnlyB']
+            results = shared_catalog.run_targets(targets, work, my_catalog, workers=2)
+            self.assertEqual([x.result for x in results], [('{}.v1_0_0.Resource'.format(x), True) for x in targets])
+
+            # files already indexed are not read again
+            my_catalog.indexNewSchemaFiles()
+            with mock.patch.object(catalog, 'scan_csdl_header', side_effect=AssertionError):
+                self.assertEqual(my_catalog.indexNewSchemaFiles(), [])
+
+    def test_parallel_catalog(self):
+        print('\n')
+        serial_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', use_snapshot=False, lazy=False)
+        parallel_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', use_snapshot=False, lazy=False, workers=2)
+        self.assertEqual(list(serial_catalog.catalog), list(parallel_catalog.catalog))
+        self.assertEqual(dump_catalog(serial_catalog), dump_catalog(parallel_catalog))
+
     def test_schema_doc(self):
         print('\n')
-        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/')
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', snapshot_dir=self.snapshot_dir)
         with open('./tests/testdata/schemas/Example_v1.xml') as f:
             my_doc = catalog.SchemaDoc(f.read(), my_catalog, 'Example_v1.xml')
         
@@ -68,10 +342,280 @@ class TestCatalog(unittest.TestCase):
 
     def test_schema_class(self):
         print('\n')
-        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/')
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', snapshot_dir=self.snapshot_dir)
         my_doc = my_catalog.getSchemaDocByClass('Example.v1_0_0')
         my_schema = my_catalog.getSchemaInCatalog('Example.v1_0_0')
     
+    def test_type_memo(self):
+        print('\n')
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', snapshot_dir=self.snapshot_dir)
+        my_type = my_catalog.getTypeInCatalog('Example.v1_7_0.Example')
+        my_tree = my_type.getTypeTree()
+        self.assertIs(my_tree[0], my_type)
+        self.assertEqual(str(my_tree[-1]), 'ExampleResource.ItemOrCollection')
+        my_properties = my_type.getProperties()
+
+        # repeated lookups don't walk the catalog again, and don't hand out the cached values
+        with mock.patch.object(my_catalog, 'getSchemaDocByClass', wraps=my_catalog.getSchemaDocByClass) as lookup:
+            my_type.getTypeTree().append('Edm.String')
+            self.assertEqual(my_type.getTypeTree(), my_tree)
+            self.assertEqual(my_type.getProperties(), my_properties)
+            with self.assertRaises(TypeError):
+                my_type.getProperties()['Id'] = None
+            my_type.getBaseType()
+            self.assertEqual(lookup.call_count, 0)
+
+            my_catalog.invalidateCaches()
+            self.assertEqual(my_type.getTypeTree(), my_tree)
+            self.assertEqual(dict(my_type.getProperties()), dict(my_properties))
+            self.assertGreater(lookup.call_count, 0)
+
+    def test_resolution_cache(self):
+        print('\n')
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', snapshot_dir=self.snapshot_dir)
+        my_type, error = my_catalog.resolve('type', 'Example.v1_7_0.Example')
+        self.assertIsNone(error)
+        self.assertIs(my_type, my_catalog.getTypeInCatalog('Example.v1_7_0.Example'))
+        my_class, error = my_catalog.resolve('action', 'Example.v1_0_0.Reset')
+        self.assertIs(my_class, my_catalog.getSchemaInCatalog('Example.v1_0_0.Reset'))
+        self.assertIsInstance(my_catalog.resolve('type', 'Contoso.v1_0_0.Widget').error, catalog.MissingSchemaError)
+        self.assertIsInstance(my_catalog.resolve('term', 'Redfish.Deprecated').error, catalog.MissingSchemaError)
+        self.assertIsInstance(my_catalog.resolve('term', 'Example.v1_0_0.Missing').error, KeyError)
+        with self.assertRaises(ValueError):
+            my_catalog.resolve('property', 'Example.v1_0_0.Id')
+
+        # repeats, found or not, don't walk the catalog again until it changes
+        with mock.patch.object(my_catalog, 'getSchemaDocByClass', wraps=my_catalog.getSchemaDocByClass) as lookup:
+            self.assertIs(my_catalog.resolve('type', 'Example.v1_7_0.Example').value, my_type)
+            self.assertIsInstance(my_catalog.resolve('type', 'Contoso.v1_0_0.Widget').error, catalog.MissingSchemaError)
+            self.assertIsInstance(my_catalog.resolve('term', 'Redfish.Deprecated').error, catalog.MissingSchemaError)
+            self.assertEqual(lookup.call_count, 0)
+
+            my_catalog.invalidateCaches()
+            self.assertIs(my_catalog.resolve('type', 'Example.v1_7_0.Example').value, my_type)
+            self.assertEqual(lookup.call_count, 1)
+
+        # each failed resolution gives a fresh error, raising it doesn't grow a stored traceback
+        errors = [my_catalog.resolve('term', 'Example.v1_0_0.Missing').error for _ in range(2)]
+        self.assertIsNot(errors[0], errors[1])
+        self.assertEqual(str(errors[0]), str(errors[1]))
+        depths = []
+        for _ in range(4):
+            try:
+                raise my_catalog.resolve('type', 'Contoso.v1_0_0.Widget').error
+            except catalog.MissingSchemaError as e:
+                depths.append(len(traceback.extract_tb(e.__traceback__)))
+        self.assertEqual(depths, [1] * 4)
+
+    def test_excerpt_members(self):
+        print('\n')
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', snapshot_dir=self.snapshot_dir)
+        my_links = my_catalog.getTypeInCatalog('Example.v1_0_0.Links')
+        my_prop = my_links.getProperties()['ContainedBy']
+        self.assertTrue(my_prop.IsNav)
+
+        def populated_members(my_type, val):
+            my_props = my_type.createObject().populate(val).properties
+            return [(name, x.Type.excerptType, x.Type.excerptTags) for name, x in my_props.items() if x.HasSchema and x.Exists]
+
+        payloads = [
+            {},
+            {'@odata.id': '/redfish/v1/Examples/1'},
+            {'Name': 'Example', 'Id': '1', 'Status': None, 'Description@Redfish.Deprecated': 'x'},
+            {'pString': 'a', 'Id': '1', 'Unknown': 1, 'Oem': {}},
+        ]
+        for val in payloads:
+            self.assertEqual(my_prop.getExcerptMembers(val), populated_members(my_prop, val), val)
+
+        # repeated values only look up the type's members
+        my_object = catalog.RedfishObject(my_links, 'Links').populate({'ContainedBy': payloads[2]})
+        with mock.patch.object(catalog.RedfishObject, 'populate') as populate:
+            self.assertTrue(validateRedfish.validateExcerpt(my_object.properties['ContainedBy'], payloads[2]))
+            self.assertEqual(populate.call_count, 0)
+
+    def test_leaf_memo(self):
+        print('\n')
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', snapshot_dir=self.snapshot_dir)
+        my_properties = my_catalog.getTypeInCatalog('Example.v1_7_0.Example').getProperties()
+        values = ['On', 'Off', 'None', '123', 'a2fc3b16-5a14-4f4d-9ba5-bb1d3b6e47b4', 10, 1.5, True, 1, 70000, -1, None, catalog.REDFISH_ABSENT]
+
+        def check_all():
+            results = []
+            for name in ['pEnum', 'pString', 'pGuid', 'pInt16', 'pDecimal', 'pPrimitive', 'pDateTimeOffset', 'Id']:
+                for val in values:
+                    try:
+                        results.append((name, val, my_properties[name].validate(val)))
+                    except ValueError as e:
+                        results.append((name, val, str(e)))
+            return results
+
+        my_catalog.leaf_memo = None
+        expected = check_all()
+        my_catalog.leaf_memo = catalog.LeafResultMemo()
+        self.assertEqual(check_all(), expected)
+        first = my_catalog.leaf_memo.info()
+        self.assertEqual(first.misses, first.currsize)
+
+        # repeats are answered from the memo, failures included
+        with mock.patch.object(catalog.RedfishProperty, 'validate_basic') as basic:
+            self.assertEqual(check_all(), expected)
+            self.assertEqual(basic.call_count, 0)
+        self.assertEqual(my_catalog.leaf_memo.info().misses, first.misses)
+        self.assertGreater(my_catalog.leaf_memo.info().hits, first.hits)
+        # values that compare equal across Python types are kept apart
+        self.assertEqual([x[2] for x in expected if x[1] is True], [x[2] for x in check_all() if x[1] is True])
+        self.assertNotEqual([x[2] for x in expected if x[1] is True], [x[2] for x in expected if x[1] == 1 and x[1] is not True])
+
+        # bounded, dropping the oldest
+        my_catalog.leaf_memo = catalog.LeafResultMemo(maxsize=4)
+        check_all()
+        self.assertEqual(my_catalog.leaf_memo.info().currsize, 4)
+        my_catalog.invalidateCaches()
+        self.assertEqual(check_all(), expected)
+
+        # swapping the memo between two types doesn't give one the other's results
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', snapshot_dir=self.snapshot_dir)
+        my_properties = my_catalog.getTypeInCatalog('Example.v1_7_0.Example').getProperties()
+        my_properties['pInt16'].validate(10)
+        my_catalog.leaf_memo = catalog.LeafResultMemo()
+        self.assertRaises(ValueError, my_properties['pInt16'].validate, 'On')
+        self.assertTrue(my_properties['pEnum'].validate('On'))
+
+    def test_validation_plan(self):
+        print('\n')
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', snapshot_dir=self.snapshot_dir)
+        my_type = my_catalog.getTypeInCatalog('ExampleResource.Health')
+        self.assertTrue(my_type.validate('OK'))
+        self.assertEqual(my_type.getValidationPlan().Enums, frozenset(['OK', 'Warning', 'Critical']))
+
+        # values are checked against the plan, not the schema
+        with mock.patch.object(catalog.CsdlElement, 'find', side_effect=AssertionError), \
+                mock.patch.object(catalog.CsdlElement, 'find_all', side_effect=AssertionError):
+            self.assertTrue(my_type.validate('Warning'))
+            self.assertRaises(ValueError, my_type.validate, 'Bad')
+            self.assertRaises(ValueError, my_type.validate, {'Unhashable': 'OK'})
+
+        # compiled patterns are reported like plain ones
+        with self.assertRaises(ValueError) as cm:
+            catalog.RedfishProperty.validate_string('abc', catalog.re.compile('[0-9]+'))
+        self.assertEqual(str(cm.exception), "String 'abc' does not match pattern ''[0-9]+''")
+        self.assertTrue(catalog.RedfishProperty.validate_string('123', catalog.re.compile('[0-9]+')))
+
+    def test_generated_validators(self):
+        print('\n')
+        values = [catalog.REDFISH_ABSENT, None, 'OK', 'Enabled', '', 'abc', 1, -1, 1.5, True, [], {'Key': 'OK'}]
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', lazy=False, snapshot_dir=self.snapshot_dir)
+        generated = my_catalog.getGeneratedValidators()
+
+        # precompiled checks give the same answers as the interpreter
+        checked = 0
+        for doc in my_catalog.catalog.values():
+            for my_class in doc.classes.values():
+                for my_type in list(my_class.entity_types.values()) + list(my_class.complex_types.values()):
+                    for prop_type in my_type.unique_properties.values():
+                        check = generated.getPropertyCheck(prop_type)
+                        if check is None:
+                            continue
+                        checked += 1
+                        for val in values:
+                            for added_pattern in [None, '[a-z]+']:
+                                try:
+                                    expected = prop_type.validate(val, added_pattern)
+                                except ValueError as e:
+                                    expected = str(e)
+                                try:
+                                    result = check(val, added_pattern)
+                                except ValueError as e:
+                                    result = str(e)
+                                self.assertEqual(result, expected, (prop_type, val))
+        self.assertGreater(checked, 50)
+
+        # used by validate when enabled, built once per type
+        my_catalog.flags['generated_validators'] = True
+        my_catalog.leaf_memo = None
+        my_catalog.invalidateCaches()
+        my_type = my_catalog.getTypeInCatalog('ExampleResource.Status')
+        with mock.patch.object(codegen, 'build_property_check', wraps=codegen.build_property_check) as builder:
+            self.assertTrue(my_type.getProperties()['Health'].validate('OK'))
+            self.assertRaises(ValueError, my_type.getProperties()['Health'].validate, 'Bad')
+            self.assertEqual(builder.call_count, 1)
+
+        # names from a schema are never run as code
+        with tempfile.TemporaryDirectory() as schema_dir:
+            marker = os.path.join(schema_dir, 'ran')
+            evil_name = 'Bad"""\n__import__(\'os\').system(\'touch {}\')\n"""'.format(marker)
+            with open(os.path.join(schema_dir, 'Evil_v1.xml'), 'w') as f:
+                f.write(DEEP_RESOURCE_SCHEMA.replace('Name="Id"', 'Name="{}"'.format(evil_name.replace('"', '&quot;').replace('\n', '&#10;'))))
+            evil_catalog = catalog.SchemaCatalog(schema_dir, use_snapshot=False)
+            evil_catalog.flags['generated_validators'] = True
+            prop_type = evil_catalog.getTypeInCatalog('Resource.v1_0_0.Resource').getProperties()[evil_name]
+            self.assertTrue(prop_type.validate('OK'))
+            self.assertFalse(os.path.exists(marker))
+            self.assertEqual(os.listdir(schema_dir), ['Evil_v1.xml'])
+
+    def test_version_index(self):
+        print('\n')
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', lazy=False, snapshot_dir=self.snapshot_dir)
+        for doc in my_catalog.catalog.values():
+            limits = list(doc.classes) + ['v9_9_9', 'v0_0_1', 'Example.v1_3_9', 'ExampleResource.v1_1_9']
+            for my_type in {x for my_class in doc.classes.values() for x in my_class.my_types}:
+                for my_limit in limits:
+                    # the linear scan of RedfishObject.populate
+                    expected = None
+                    for top_ns, schema in reversed(list(doc.classes.items())):
+                        if my_type in schema.my_types:
+                            if catalog.splitVersionString(top_ns) <= catalog.splitVersionString(my_limit):
+                                expected = top_ns
+                                break
+                    self.assertEqual(doc.getCastNamespace(my_type, my_limit), expected, (my_type, my_limit))
+
+        my_class = my_catalog.getSchemaInCatalog('Example')
+        self.assertEqual(my_class.getHighestType('Example.v1_9_9.Example'), 'Example.v1_7_0.Example')
+        self.assertEqual(my_class.getHighestType('Example.v1_9_9.Example', 'Example.v1_1_1'), 'Example.v1_1_0.Example')
+
+    def test_type_ancestry(self):
+        print('\n')
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', lazy=False, snapshot_dir=self.snapshot_dir)
+        my_types = [y for doc in my_catalog.catalog.values() for my_class in doc.classes.values() for y in my_class.my_types.values()]
+        names = {str(x) for my_type in my_types for x in my_type.getTypeTree()} | {'NotExample.NotExample'}
+        for my_type in my_types:
+            my_tree = my_type.getTypeTree()
+            for name in names:
+                self.assertEqual(my_type.isA(name), name in my_tree, (my_type, name))
+            self.assertEqual(my_type.isA('NotExample.NotExample', 'Resource.Resource'), 'Resource.Resource' in my_tree)
+            for other in my_types:
+                expected = any(str(x) in [str(y) for y in my_tree] for x in other.getTypeTree())
+                self.assertEqual(my_type.getAncestry() & other.getAncestry() != 0, expected, (my_type, other))
+
+        # ids stay the same when derived values are dropped
+        my_type = my_catalog.getTypeInCatalog('Example.v1_7_0.Example')
+        ancestry = my_type.getAncestry()
+        my_catalog.invalidateCaches()
+        self.assertEqual(my_type.getAncestry(), ancestry)
+        self.assertTrue(my_type.isA('ExampleResource.ItemOrCollection'))
+
+    def test_type_name(self):
+        print('\n')
+        for string in ['Example.v1_3_0.Example', '#Example.v1_3_0.Example', 'Example.Example', 'Example', 'v1_2_3', '1.6.0', 'Resource.OemObject']:
+            my_name = helper.getTypeName(string)
+            self.assertIs(my_name, helper.getTypeName(string))
+            self.assertIs(my_name, helper.getTypeName(my_name))
+            self.assertEqual(my_name, string)
+            self.assertEqual(hash(my_name), hash(string))
+            for func in [helper.getNamespace, helper.getNamespaceUnversioned, helper.getType, helper.getVersion, helper.splitVersionString]:
+                try:
+                    expected = func(string)
+                except ValueError:
+                    self.assertRaises(ValueError, func, my_name)
+                    continue
+                self.assertEqual(func(my_name), expected, (func.__name__, string))
+        self.assertIs(helper.getNamespace(helper.getTypeName('Example.v1_3_0.Example')), helper.getTypeName('Example.v1_3_0'))
+
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', snapshot_dir=self.snapshot_dir)
+        my_type = my_catalog.getTypeInCatalog(helper.getTypeName('Example.v1_0_0.Example'))
+        self.assertIsInstance(my_type.fulltype, helper.TypeName)
+        self.assertEqual(my_type.Namespace.version_tuple, (1, 0, 0))
+
     def test_basic_properties(self):
         print('\nTesting basic types as json')
         prop = catalog.RedfishProperty("Edm.Int").populate(1)
@@ -97,7 +641,7 @@ class TestCatalog(unittest.TestCase):
     
     def test_object(self):
         print('\nTesting object values')
-        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/')
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', snapshot_dir=self.snapshot_dir)
         my_schema_doc = my_catalog.getSchemaDocByClass("ExampleResource.v1_0_0.ExampleResource")
         my_type = my_schema_doc.getTypeInSchemaDoc("ExampleResource.v1_0_0.ExampleResource")
         object = catalog.RedfishObject( my_type )
@@ -109,8 +653,238 @@ class TestCatalog(unittest.TestCase):
         dct = object.as_json()
         dct = object.getLinks()
 
+    def test_synthetic_types(self):
+        print('\n')
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', snapshot_dir=self.snapshot_dir)
+        my_type = my_catalog.getTypeInCatalog('ExampleResource.Oem')
+
+        # same as a type built from a parsed Term tag
+        from bs4 import BeautifulSoup
+        parsed_type = catalog.RedfishType(BeautifulSoup('<Term Name="A" Type="Edm.Int64"> </Term>', 'xml').find('Term'), my_type.owner)
+        synthetic_type = my_type.owner.getSyntheticType('Edm.Int64')
+        self.assertIs(my_type.owner.getSyntheticType('Edm.Int64'), synthetic_type)
+        self.assertEqual(dump_type(synthetic_type), dump_type(parsed_type))
+        self.assertEqual(vars(synthetic_type.getValidationPlan()), vars(parsed_type.getValidationPlan()))
+        self.assertEqual(synthetic_type.getBaseType(), parsed_type.getBaseType())
+        for val in [1, 'one', None, catalog.REDFISH_ABSENT]:
+            # RedfishType only compares to strings
+            synthetic_json = catalog.RedfishProperty(synthetic_type).populate(val, check=True).as_json()
+            parsed_json = catalog.RedfishProperty(parsed_type).populate(val, check=True).as_json()
+            self.assertEqual({x: str(y) for x, y in synthetic_json.items()}, {x: str(y) for x, y in parsed_json.items()})
+
+        # dynamic properties of an Edm type share one type per Edm type
+        dynamic = {'Pattern': '[A-Za-z]+', 'Type': 'Edm.String'}
+        with mock.patch.object(catalog.RedfishType, 'DynamicProperties', new_callable=mock.PropertyMock, return_value=dynamic):
+            my_object = catalog.RedfishObject(my_type, 'Oem').populate({'Alpha': 'a', 'Beta': 'b', '1Gamma': 'c'}, check=True)
+        self.assertIs(my_object['Alpha'].Type, my_type.owner.getSyntheticType('Edm.String'))
+        self.assertIs(my_object['Beta'].Type, my_object['Alpha'].Type)
+        self.assertEqual(my_object['Beta'].Value, 'b')
+        self.assertNotIn('1Gamma', my_object.properties)
+
+    def test_object_memory(self):
+        print('\n')
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', snapshot_dir=self.snapshot_dir)
+        my_type = my_catalog.getTypeInCatalog('Example.v1_7_0.Example')
+        with open('./tests/testdata/payloads/simple.json') as f:
+            payload = json.load(f)
+        my_object = catalog.RedfishObject.getPrototype(my_type).populate(payload, check=True)
+
+        # nodes keep no instance dict, and everything they hold is in a slot; see tests/benchmark_catalog.py for their size
+        for node in [my_object, my_object['pInt16']]:
+            self.assertFalse(hasattr(node, '__dict__'))
+            self.assertEqual(set(node._fields), {x for cls in type(node).__mro__ for x in getattr(cls, '__slots__', ())})
+        # copies hold the same values
+        my_copy = my_object._copy()
+        self.assertEqual([getattr(my_copy, x) for x in my_copy._fields], [getattr(my_object, x) for x in my_object._fields])
+
+    def test_object_prototype(self):
+        print('\n')
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', snapshot_dir=self.snapshot_dir)
+        my_type = my_catalog.getTypeInCatalog('Example.v1_7_0.Example')
+        with open('./tests/testdata/payloads/simple.json') as f:
+            payload = json.load(f)
+        payload['@odata.type'] = '#Example.v1_7_0.Example'
+
+        # built once, and populating doesn't change it
+        my_prototype = catalog.RedfishObject.getPrototype(my_type)
+        self.assertIs(catalog.RedfishObject.getPrototype(my_type), my_prototype)
+        self.assertIs(my_type.createObject(), my_prototype)
+        expected = catalog.RedfishObject(my_type).populate(payload, check=True)
+        for _ in range(2):
+            my_object = my_prototype.populate(payload, check=True)
+            self.assertEqual(my_object.as_json(), expected.as_json())
+            self.assertEqual([x.Name for x in my_object.getLinks()], [x.Name for x in expected.getLinks()])
+        self.assertFalse(my_prototype.Populated)
+        self.assertTrue(all(not x.Populated for x in my_prototype.properties.values()))
+
+        # objects below a populated parent aren't kept
+        kept = len(my_object.prototypes)
+        my_child = catalog.RedfishObject.getPrototype(my_type, 'Child', my_object)
+        self.assertIsNot(catalog.RedfishObject.getPrototype(my_type, 'Child', my_object), my_child)
+        self.assertEqual(len(my_object.prototypes), kept)
+
+        # only declared properties are kept, arbitrary names are built on every call
+        declared = [x for x, y in my_prototype.properties.items() if isinstance(y, catalog.RedfishObject)][0]
+        declared_type = my_prototype.properties[declared].Type
+        self.assertIs(catalog.RedfishObject.getPrototype(declared_type, declared, my_prototype),
+                      catalog.RedfishObject.getPrototype(declared_type, declared, my_prototype))
+        kept = len(my_prototype.prototypes)
+        for name in ['Additional{}'.format(x) for x in range(10)] + ['{}@Example.Annotation'.format(declared)]:
+            self.assertIsNot(catalog.RedfishObject.getPrototype(declared_type, name, my_prototype),
+                             catalog.RedfishObject.getPrototype(declared_type, name, my_prototype))
+        self.assertEqual(len(my_prototype.prototypes), kept)
+
+        my_catalog.invalidateCaches()
+        self.assertIsNot(catalog.RedfishObject.getPrototype(my_type), my_prototype)
+
+    def test_populate_once(self):
+        print('\n')
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', snapshot_dir=self.snapshot_dir)
+        my_type = my_catalog.getTypeInCatalog('Example.v1_7_0.Example')
+        with open('./tests/testdata/payloads/simple.json') as f:
+            payload = json.load(f)
+        payload['@odata.type'] = '#Example.v1_7_0.Example'
+        payload['ComplexInner'] = {'cEnum': 'On'}
+        payload['PhysicalSecurity'] = {'IntrusionSensorNumber': 1}
+        payload['Links'] = {'ContainedBy': {'@odata.id': '/redfish/v1/Examples/2'}}
+
+        # casting hands a subtree over to its new type, every other call on a value populates a new subtree
+        calls = []
+        populate = catalog.RedfishObject.populate
+        def counted(obj, sub_payload, check=False, casted=False):
+            if not casted and isinstance(sub_payload, dict):
+                calls.append(id(sub_payload))
+            return populate(obj, sub_payload, check=check, casted=casted)
+
+        with mock.patch.object(catalog.RedfishObject, 'populate', counted):
+            my_object = catalog.RedfishObject(my_type).populate(payload, check=True)
+            populated = len(calls)
+            self.assertEqual(len(set(calls)), populated)
+            self.assertGreaterEqual(populated, 4)
+
+            # checking complex values reuses the populated tree
+            for my_prop in my_object.properties.values():
+                if isinstance(my_prop, catalog.RedfishObject) and my_prop.Exists:
+                    self.assertTrue(my_prop.Type.validate(my_prop.Value))
+                    self.assertTrue(my_prop.Collection[0].Populated)
+            self.assertEqual(len(calls), populated)
+
+    def test_iterative_populate(self):
+        print('\n')
+        # same trees from both engines
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', snapshot_dir=self.snapshot_dir)
+        my_type = my_catalog.getTypeInCatalog('Example.v1_7_0.Example')
+        with open('./tests/testdata/payloads/simple.json') as f:
+            payload = json.load(f)
+        payload['ComplexInner'] = {'cEnum': 'On'}
+        payload['Links'] = {'ContainedBy': {'@odata.id': '/redfish/v1/Examples/2'}, 'Oem': {'Contoso': {}}}
+        for val in [payload, None, catalog.REDFISH_ABSENT, [payload, 'bad']]:
+            expected = catalog.RedfishObject(my_type).populate(val, check=True)
+            my_catalog.flags['iterative_populate'] = True
+            my_object = catalog.RedfishObject(my_type).populate(val, check=True)
+            my_catalog.flags['iterative_populate'] = False
+            self.assertEqual(str(my_object.as_json()), str(expected.as_json()))
+
+        # OEM objects nest through additional properties, the iterative engine goes past the recursion limit
+        with tempfile.TemporaryDirectory() as schema_dir:
+            with open(os.path.join(schema_dir, 'Resource_v1.xml'), 'w') as f:
+                f.write(DEEP_RESOURCE_SCHEMA)
+            deep_catalog = catalog.SchemaCatalog(schema_dir, use_snapshot=False)
+            deep_type = deep_catalog.getTypeInCatalog('Resource.v1_0_0.Resource')
+            depth = sys.getrecursionlimit() + 100
+            payload = {'Id': '1', 'Oem': {}}
+            node = payload['Oem']
+            for _ in range(depth):
+                node['Level'] = {}
+                node = node['Level']
+            deep_catalog.flags['iterative_populate'] = True
+            my_object = catalog.RedfishObject(deep_type).populate(payload).properties['Oem']
+            levels = 0
+            while 'Level' in my_object.properties:
+                my_object, levels = my_object.properties['Level'], levels + 1
+            self.assertEqual(levels, depth)
+
+    def test_lazy_populate(self):
+        print('\n')
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', snapshot_dir=self.snapshot_dir)
+        my_type = my_catalog.getTypeInCatalog('Example.v1_7_0.Example')
+        with open('./tests/testdata/payloads/simple.json') as f:
+            payload = json.load(f)
+        payload['ComplexInner'] = {'cEnum': 'On'}
+        payload['Links'] = {'Oem': {'Contoso': {}}}
+        payload['Oem'] = {'Contoso': {}}
+        payload['Unknown'] = 1
+        payload['@odata.type'] = '#Example.v1_7_0.Example'
+
+        def check_all(my_object, oem_check):
+            service = mock.Mock(config={'oemcheck': oem_check})
+            results = []
+            for name, prop in my_object.properties.items():
+                results.append(validateRedfish.checkPropertyConformance(service, name, prop))
+            return results
+
+        # the same results, populating only what is read
+        for oem_check in [True, False]:
+            expected = check_all(catalog.RedfishObject(my_type).populate(payload, check=True), oem_check)
+            my_catalog.flags['lazy_populate'] = True
+            my_object = catalog.RedfishObject(my_type).populate(payload, check=True)
+            self.assertIsInstance(my_object.properties, catalog.LazyProperties)
+            self.assertFalse(my_object.properties.populated)
+            self.assertEqual(check_all(my_object, oem_check), expected)
+            my_catalog.flags['lazy_populate'] = False
+
+            my_oem = my_object.properties['Oem']
+            self.assertIn('Contoso', my_oem.properties)
+            self.assertEqual(bool(my_oem.properties.populated), oem_check)
+            self.assertNotIn('PhysicalSecurity', payload)
+            self.assertFalse(my_object.properties['PhysicalSecurity'].properties.populated)
+
+        my_catalog.flags['lazy_populate'] = True
+        my_object = catalog.RedfishObject(my_type).populate(payload)
+        my_catalog.flags['lazy_populate'] = False
+        self.assertEqual(str(my_object.as_json()), str(catalog.RedfishObject(my_type).populate(payload).as_json()))
+
+    def test_link_records(self):
+        print('\n')
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', snapshot_dir=self.snapshot_dir)
+        my_type = my_catalog.getTypeInCatalog('Example.v1_7_0.Example')
+        with open('./tests/testdata/payloads/simple.json') as f:
+            payload = json.load(f)
+        payload['@odata.type'] = '#Example.v1_7_0.Example'
+        payload['Links'] = {
+            'ContainedBy': {'@odata.id': '/redfish/v1/Examples/2'},
+            'Contains': [{'@odata.id': '/redfish/v1/Examples/3'}, {'@odata.id': '/redfish/v1/Examples/4'}],
+            'PoweredBy': [],
+        }
+
+        # collected while populating, the same as walking the populated tree
+        my_object = catalog.RedfishObject(my_type).populate(payload)
+        self.assertIsNotNone(my_object.links)
+        my_links = my_object.getLinks()
+        self.assertEqual([(x.Name, x.Value, str(x.Type), x.InAnnotation) for x in my_links], [
+            ('ContainedBy', {'@odata.id': '/redfish/v1/Examples/2'}, 'Example.Example', False),
+            ('Contains#0', {'@odata.id': '/redfish/v1/Examples/3'}, 'Example.Example', False),
+            ('Contains#1', {'@odata.id': '/redfish/v1/Examples/4'}, 'Example.Example', False),
+        ])
+        self.assertEqual(my_object._collectLinks(), my_links)
+        self.assertTrue(all(x.parent is my_links[0].parent for x in my_links))
+        self.assertEqual(str(my_links[0].parent.Type), 'Example.v1_7_0.Links')
+
+        # the list handed out is a copy, and nothing walks the tree again
+        my_links.append(None)
+        with mock.patch.object(catalog.RedfishObject, '_collectLinks') as collect:
+            self.assertEqual(len(my_object.getLinks()), 3)
+            self.assertEqual(collect.call_count, 0)
+
+        # without the ActionInfo schema, getLinks raises as before
+        payload['Actions'] = {'#Example.Reset': {'target': '/redfish/v1/Examples/1/Actions/Example.Reset',
+                                                 '@Redfish.ActionInfo': '/redfish/v1/Examples/1/ResetActionInfo'}}
+        my_object = catalog.RedfishObject(my_type).populate(payload)
+        self.assertIsNone(my_object.links)
+        self.assertRaises(catalog.MissingSchemaError, my_object.getLinks)
+
     def test_capabilities(self):
-        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/')
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', snapshot_dir=self.snapshot_dir)
         my_schema_doc = my_catalog.getSchemaDocByClass("Example.v1_0_0.Example")
         my_type = my_schema_doc.getTypeInSchemaDoc("Example.v1_0_0.Example")
         my_capabilities = my_type.getCapabilities()
@@ -123,9 +897,37 @@ class TestCatalog(unittest.TestCase):
         self.assertFalse(my_type.CanInsert)
         self.assertFalse(my_type.CanDelete)
     
+    def test_annotation_index(self):
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', snapshot_dir=self.snapshot_dir)
+        my_type = my_catalog.getTypeInCatalog('Example.v1_7_0.Example')
+        answers = (my_type.getCapabilities(), my_type.getUris(), my_type.HasAdditional, my_type.DynamicProperties)
+        self.assertIsNone(my_type.getAnnotation('Redfish.Uris'))
+        self.assertEqual(my_catalog.getTypeInCatalog('Example.Example').getAnnotation('Redfish.Uris')['Term'], 'Redfish.Uris')
+
+        # once indexed, no more searching through the schema
+        with mock.patch.object(catalog.CsdlElement, 'find', side_effect=AssertionError), \
+                mock.patch.object(catalog.CsdlElement, 'find_all', side_effect=AssertionError):
+            self.assertEqual((my_type.getCapabilities(), my_type.getUris(), my_type.HasAdditional, my_type.DynamicProperties), answers)
+            self.assertTrue(my_type.CanUpdate)
+
+    def test_uri_templates(self):
+        print('\n')
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', snapshot_dir=self.snapshot_dir)
+        my_type = my_catalog.getTypeInCatalog('Example.v1_0_0.Example')
+        my_matcher = my_type.getUriMatcher()
+        self.assertEqual(my_matcher.match('/redfish/v1/Example'), ('/redfish/v1/Example', 0, False))
+        self.assertEqual(my_matcher.match('/redfish/v1/Examples/1'), ('/redfish/v1/Examples/{ExampleId}', 1, True))
+        self.assertIsNone(my_matcher.match('/redfish/v1/Examples'))
+
+        my_index = my_catalog.getUriIndex()
+        self.assertEqual(my_index.getCandidateTypes('/redfish/v1/Examples/1'), ['Example.Example'])
+        self.assertEqual(my_index.getCandidateTypes('/redfish/v1/Examples/SubObject/1/'), ['Example.Example'])
+        self.assertEqual(my_index.getCandidateTypes('/redfish/v1/Examples/1/Extra'), [])
+        self.assertEqual(my_index.getCandidateTypes('/redfish/v1/'), [])
+
     def test_expected_uris(self):
         print('\nTesting expected Uris')
-        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/')
+        my_catalog = catalog.SchemaCatalog('./tests/testdata/schemas/', snapshot_dir=self.snapshot_dir)
         my_schema_doc = my_catalog.getSchemaDocByClass("Example.v1_0_0.Example")
         my_type = my_schema_doc.getTypeInSchemaDoc("Example.v1_0_0.Example")
         object = catalog.RedfishObject( my_type )